@@ -0,0 +1,77 @@
+from typing import Literal
+
+from aiogram.filters.callback_data import CallbackData
+
+from app.db.models import ItemStatus
+
+
+# Each factory packs to the same "prefix:field:..." string the keyboards
+# used to build by hand, so buttons already sent to chats keep working.
+
+
+def packed_prefix(factory: type[CallbackData]) -> str:
+    """
+    "prefix:" of a factory, for list keyboards that pack one id per row:
+    f"{prefix}{id}" equals factory(id).pack() without a model instance per button.
+    """
+    return f"{factory.__prefix__}{factory.__separator__}"
+
+# ── User flows ──────────────────────────────────────────────────────────────
+
+class CategoryCB(CallbackData, prefix="cat"):
+    category_id: int
+
+
+class ItemCB(CallbackData, prefix="item"):
+    item_id: int
+
+
+class BackToItemsCB(CallbackData, prefix="back"):
+    section: Literal["items"] = "items"
+    item_id: int
+
+
+class TakeCB(CallbackData, prefix="take"):
+    item_id: int
+
+
+class ReturnCB(CallbackData, prefix="return"):
+    item_id: int
+
+
+# ── Admin: Item management ──────────────────────────────────────────────────
+
+class AdminItemCreateCB(CallbackData, prefix="adm_item_create"):
+    category_id: int
+
+
+class AdminItemRenameCB(CallbackData, prefix="adm_item_rename"):
+    item_id: int
+
+
+class AdminItemCodeCB(CallbackData, prefix="adm_item_code"):
+    item_id: int
+
+
+class AdminItemStatusCB(CallbackData, prefix="adm_item_status"):
+    item_id: int
+    status: ItemStatus
+
+
+class AdminItemDeleteCB(CallbackData, prefix="adm_item_del"):
+    item_id: int
+
+
+class AdminItemDeleteConfirmCB(CallbackData, prefix="adm_item_del_yes"):
+    item_id: int
+    category_id: int
+
+
+# ── Admin: User management ──────────────────────────────────────────────────
+
+class AdminUserCB(CallbackData, prefix="adm_user"):
+    user_id: int
+
+
+class AdminUserToggleCB(CallbackData, prefix="adm_user_toggle"):
+    user_id: int
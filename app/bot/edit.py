@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup
+
+
+async def edit_message(
+    callback: CallbackQuery,
+    text: str,
+    reply_markup: InlineKeyboardMarkup | None = None,
+) -> None:
+    """
+    Re-render the callback's message with as little Bot API traffic as possible.
+    The callback carries the message as the user sees it, so an identical
+    render is skipped and an unchanged text only sends the keyboard.
+    A no-op edit ("message is not modified") is ignored.
+    """
+    message = callback.message
+    same_text = message.html_text == text
+    if same_text and message.reply_markup == reply_markup:
+        return
+    try:
+        if same_text:
+            await message.edit_reply_markup(reply_markup=reply_markup)
+        else:
+            await message.edit_text(text, reply_markup=reply_markup)
+    except TelegramBadRequest as e:
+        if "message is not modified" not in e.message:
+            raise
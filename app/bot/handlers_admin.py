@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 from datetime import timezone
+from typing import Final
 
 from aiogram import F, Router
+from aiogram.exceptions import TelegramRetryAfter
 from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, Message
-
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
+
+from app.bot import list_cache, user_cache
+from app.bot.callbacks import (
+    AdminItemCodeCB,
+    AdminItemCreateCB,
+    AdminItemDeleteCB,
+    AdminItemDeleteConfirmCB,
+    AdminItemRenameCB,
+    AdminItemStatusCB,
+    AdminUserCB,
+    AdminUserToggleCB,
+)
+from app.bot.edit import edit_message
+from app.bot.list_cache import async_cached
 from app.bot.keyboards import (
     admin_categories_keyboard,
     admin_category_actions_keyboard,
@@ -20,7 +37,9 @@ from app.bot.keyboards import (
     item_history_keyboard,
     main_menu_keyboard,
     overview_available_keyboard,
+    overview_back_keyboard,
     overview_on_hands_keyboard,
+    tx_photo_back_keyboard,
     tx_photo_keyboard,
     admin_search_results_keyboard,
     admin_problem_report_keyboard,
@@ -33,52 +52,102 @@ from app.bot.states import (
     AdminEditItem,
     AdminSearch,
     AdminMessagingStates,
+    enter_state,
 )
-from app.config import get_settings
+from app.bot.texts import STATUS_LABELS, format_item_detail
+from app.bot.user_cache import CachedUser
 from app.core.admin_service import AdminService
-from app.core.inventory_service import InventoryService
-from app.db.models import ItemStatus
+from app.db.models import ItemStatus, TransactionAction
+from app.db.repositories import (
+    CategoryRepository,
+    ItemRepository,
+    TransactionRepository,
+    UserRepository,
+)
 from app.db.session import get_session
 
 
 admin_router = Router()
 
-
 # ────────────────────────── Helpers ─────────────────────────────────────────
 
-async def _get_admin_user(from_user):
-    """Return User if admin, else None."""
-    settings = get_settings()
-    async with get_session() as session:
-        inv = InventoryService(session)
-        user = await inv.ensure_user(
-            telegram_id=from_user.id,
-            username=from_user.username,
-            first_name=from_user.first_name,
-            last_name=from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
-        await session.commit()
-    return user if user.is_admin else None
-
-
-async def _require_admin(message_or_cb) -> bool:
-    """Send error and return False if not admin."""
+async def _require_admin(message_or_cb) -> CachedUser | None:
+    """
+    Return the admin user, or send an error and return None if not admin.
+    Served from user_cache; a session is opened only on a cache miss.
+    """
     from_user = getattr(message_or_cb, "from_user", None)
     if from_user is None:
-        return False
-    if isinstance(message_or_cb, CallbackQuery):
-        user = await _get_admin_user(from_user)
-        if not user:
+        return None
+    user = await user_cache.get_user(from_user)
+    if not user.is_admin:
+        if isinstance(message_or_cb, CallbackQuery):
             await message_or_cb.answer("⛔ Нет доступа.", show_alert=True)
-            return False
-    else:
-        user = await _get_admin_user(from_user)
-        if not user:
+        else:
             await message_or_cb.answer("⛔ У вас нет прав администратора.")
-            return False
-    return True
+        return None
+    return user
+
+
+async def _gather_reads(*coro_factories):
+    """
+    Run independent read-only queries concurrently.
+    AsyncSession is not safe for concurrent use, so each factory gets its
+    own session: `factory(session) -> awaitable`.
+    """
+    async def _run(factory):
+        async with get_session() as session:
+            return await factory(session)
+
+    return await asyncio.gather(*(_run(f) for f in coro_factories))
+
+
+# strong refs so fire-and-forget tasks are not garbage-collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Run a coroutine in the background without awaiting it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _answer_early(callback: CallbackQuery) -> None:
+    """
+    Dismiss the callback spinner without waiting for it.
+    Telegram accepts a single answer per callback, so only call this once
+    the handler can no longer fail with a `show_alert` answer.
+    """
+    _spawn(callback.answer())
+
+
+# Caps how many Telegram sends handlers have in flight at once (not a per-second
+# rate); a flood-wait sleep happens outside it so other sends keep their slots
+_SEND_SEM = asyncio.Semaphore(25)
+_SEND_MAX_ATTEMPTS = 3
+
+
+def _bounded_send(send):
+    """Wrap a Telegram send method with a concurrency cap and flood-wait back-off."""
+    @functools.wraps(send)
+    async def wrapper(*args, **kwargs):
+        for attempt in range(_SEND_MAX_ATTEMPTS):
+            try:
+                async with _SEND_SEM:
+                    return await send(*args, **kwargs)
+            except TelegramRetryAfter as e:
+                if attempt == _SEND_MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(e.retry_after)
+
+    return wrapper
+
+
+def _clean(text: str | None) -> str:
+    """Stripped message text, or "" for non-text messages."""
+    return text.strip() if text else ""
 
 
 def _user_display(user) -> str:
@@ -106,17 +175,7 @@ async def admin_entry(message: Message) -> None:
 @admin_router.message(F.text == "← Вернуться в меню")
 async def back_to_user_menu(message: Message, state: FSMContext) -> None:
     await state.clear()
-    settings = get_settings()
-    async with get_session() as session:
-        inv = InventoryService(session)
-        user = await inv.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
+    user = await user_cache.get_user(message.from_user)
     await message.answer(
         "🏠 Главное меню:",
         reply_markup=main_menu_keyboard(is_admin=user.is_admin),
@@ -129,8 +188,9 @@ def _fmt_dt(dt) -> str:
     """Format datetime to readable local-ish string."""
     if dt is None:
         return "—"
-    # Store is UTC, display as-is with label
-    return dt.strftime("%d.%m.%Y %H:%M")
+    # Store is UTC, display as-is with label.
+    # Manual formatting skips strftime's per-call format parsing.
+    return f"{dt.day:02d}.{dt.month:02d}.{dt.year} {dt.hour:02d}:{dt.minute:02d}"
 
 
 def _user_short(user) -> str:
@@ -147,48 +207,48 @@ def _user_short(user) -> str:
     return name or f"ID {user.telegram_id}"
 
 
-async def _build_overview_text_and_kb():
-    """Build overview: on-hands items with real names + date taken."""
-    from app.db.repositories import ItemRepository, TransactionRepository, CategoryRepository
-    from app.db.models import ItemStatus
+_OVERVIEW_ROW: Final = "  🔴 <b>%s</b>\n      👤 %s  📅 %s"
 
-    async with get_session() as session:
-        item_repo = ItemRepository(session)
-        tx_repo = TransactionRepository(session)
-        cat_repo = CategoryRepository(session)
 
-        on_hands = await item_repo.list_on_hands()
-        available = await item_repo.list_available()
-        categories = await cat_repo.list_all()
+async def _on_hands_with_latest_takes(session):
+    # the latest-take read needs the item ids, so it shares the on-hands session
+    items = await ItemRepository(session).list_on_hands()
+    latest_takes = await TransactionRepository(session).get_latest_takes_for_items(
+        [it.id for it in items]
+    )
+    return items, latest_takes
 
-        # Get last TAKE tx for each taken item
-        on_hands_details = []
-        for item in on_hands:
-            tx = await tx_repo.get_latest_take_for_item(item.id)
-            holder_name = _user_short(tx.user) if tx else "неизвестно"
-            date_str = _fmt_dt(tx.created_at) if tx else "—"
-            on_hands_details.append((item.id, item.name, holder_name, date_str))
 
-    total_cats = len([c for c in categories if c.is_active])
+async def _build_overview_text_and_kb():
+    """Build overview: on-hands items with real names + date taken."""
+    (on_hands, latest_takes), available_count, total_cats = await _gather_reads(
+        _on_hands_with_latest_takes,
+        lambda s: ItemRepository(s).count_by_status(ItemStatus.AVAILABLE),
+        lambda s: CategoryRepository(s).count_active(),
+    )
+
     text_lines = [
         "<b>📊 Обзор инвентаря</b>",
         "",
         f"📂 Активных категорий: <b>{total_cats}</b>",
-        f"✅ Доступно: <b>{len(available)}</b>   🔴 Выдано: <b>{len(on_hands)}</b>",
+        f"✅ Доступно: <b>{available_count}</b>   🔴 Выдано: <b>{len(on_hands)}</b>",
+        "",
     ]
 
-    if on_hands_details:
-        text_lines.append("")
+    # Text rows and keyboard entries are built in the same pass
+    kb_items = []
+    if on_hands:
         text_lines.append("<b>Выдано сейчас — нажми для истории:</b>")
-        for _, name, holder, date_str in on_hands_details:
-            text_lines.append(f"  🔴 <b>{name}</b>")
-            text_lines.append(f"      👤 {holder}  📅 {date_str}")
+        for item in on_hands:
+            tx = latest_takes.get(item.id)
+            holder_name = _user_short(tx.user) if tx else "неизвестно"
+            date_str = _fmt_dt(tx.created_at) if tx else "—"
+            text_lines.append(_OVERVIEW_ROW % (item.name, holder_name, date_str))
+            kb_items.append((item.id, item.name, holder_name))
     else:
-        text_lines.append("")
         text_lines.append("<i>Все позиции доступны.</i>")
 
-    kb_items = [(iid, iname, holder) for iid, iname, holder, _ in on_hands_details]
-    return "\n".join(text_lines), kb_items, len(available)
+    return "\n".join(text_lines), kb_items, available_count
 
 
 @admin_router.message(F.text == "📊 Обзор")
@@ -205,15 +265,14 @@ async def inventory_overview(message: Message) -> None:
 
 @admin_router.callback_query(F.data == "ovr_back")
 async def ovr_back_to_overview(callback: CallbackQuery) -> None:
+    _answer_early(callback)
     text, kb_items, _ = await _build_overview_text_and_kb()
     await callback.message.edit_text(text, reply_markup=overview_on_hands_keyboard(kb_items))
-    await callback.answer()
 
 
 @admin_router.callback_query(F.data == "ovr_available")
 async def ovr_show_available(callback: CallbackQuery) -> None:
     async with get_session() as session:
-        from app.db.repositories import ItemRepository
         item_repo = ItemRepository(session)
         available = await item_repo.list_available()
 
@@ -221,12 +280,12 @@ async def ovr_show_available(callback: CallbackQuery) -> None:
         await callback.answer("✅ Нет доступных позиций", show_alert=True)
         return
 
-    items_data = [(it.id, it.name) for it in available]
+    _answer_early(callback)
+
     await callback.message.edit_text(
         f"✅ <b>Доступные позиции</b> ({len(available)} шт.):",
-        reply_markup=overview_available_keyboard(items_data),
+        reply_markup=overview_available_keyboard((it.id, it.name) for it in available),
     )
-    await callback.answer()
 
 
 @admin_router.callback_query(F.data.startswith("ovr_item:"))
@@ -234,71 +293,62 @@ async def ovr_item_history(callback: CallbackQuery) -> None:
     item_id = int(callback.data.split(":", maxsplit=1)[1])
 
     async with get_session() as session:
-        from app.db.repositories import ItemRepository, TransactionRepository
-        from app.db.models import TransactionAction
-        item_repo = ItemRepository(session)
-        tx_repo = TransactionRepository(session)
+        item = await ItemRepository(session).get_by_id(item_id)
 
-        item = await item_repo.get_by_id(item_id)
-        if item is None:
-            await callback.answer("❌ Позиция не найдена", show_alert=True)
-            return
+    if item is None:
+        await callback.answer("❌ Позиция не найдена", show_alert=True)
+        return
+
+    _answer_early(callback)
 
-        transactions = await tx_repo.list_for_item_with_user(item_id, limit=30)
+    if item.status is ItemStatus.TAKEN:
+        # Holder comes from the latest TAKE, even if it is older than the history window
+        transactions, last_take = await _gather_reads(
+            lambda s: TransactionRepository(s).list_for_item_with_user(item_id, limit=30),
+            lambda s: TransactionRepository(s).get_latest_take_for_item(item_id),
+        )
+    else:
+        async with get_session() as session:
+            transactions = await TransactionRepository(session).list_for_item_with_user(
+                item_id, limit=30
+            )
+        last_take = None
 
-    STATUS_LABELS = {
-        "available": "✅ Доступно",
-        "taken": "🔴 Выдано",
-        "lost": "❓ Утеряно",
-        "maintenance": "🔧 На обслуживании",
-    }
-    status_label = STATUS_LABELS.get(item.status.value, item.status.value)
     code_info = f"\nКод: <code>{item.inventory_code}</code>" if item.inventory_code else ""
 
     if transactions:
-        # Current holder info from last TAKE
-        from app.db.models import TransactionAction as TA
-        last_take = next((t for t in transactions if t.action.value == "take"), None)
         holder_info = ""
-        if last_take and item.status.value == "taken":
+        if last_take:
             holder_info = (
                 f"\n👤 Держатель: <b>{_user_short(last_take.user)}</b>"
                 f"\n📅 Взято: <b>{_fmt_dt(last_take.created_at)}</b>"
             )
 
-        tx_data = []
-        for t in transactions:
-            action_emoji = "✋" if t.action.value == "take" else "↩️"
-            date_str = _fmt_dt(t.created_at)
-            u_name = _user_short(t.user)
-            tx_data.append((t.id, action_emoji, u_name, date_str))
+        # each row's button text is finished here; the keyboard only wraps it
+        tx_rows = [
+            (
+                t.id,
+                f"{'✋' if t.action is TransactionAction.TAKE else '↩️'} "
+                f"{_user_short(t.user)} · {_fmt_dt(t.created_at)}",
+            )
+            for t in transactions
+        ]
 
         text = (
-            f"<b>📦 {item.name}</b>"
-            f"\nСтатус: {status_label}"
-            f"{code_info}"
-            f"{holder_info}"
-            f"\n\n<b>История ({len(transactions)} записей):</b>"
+            format_item_detail(item.name, item.status.value, code_info, holder_info)
+            + f"\n\n<b>История ({len(transactions)} записей):</b>"
             f"\n<i>Нажми на запись — увидишь детали и фото</i>"
         )
         await callback.message.edit_text(
             text,
-            reply_markup=item_history_keyboard(tx_data, item_id),
+            reply_markup=item_history_keyboard(tx_rows, item_id),
         )
     else:
         text = (
-            f"<b>📦 {item.name}</b>"
-            f"\nСтатус: {status_label}"
-            f"{code_info}"
-            f"\n\n<i>История операций пуста.</i>"
+            format_item_detail(item.name, item.status.value, code_info)
+            + "\n\n<i>История операций пуста.</i>"
         )
-        from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-        kb = InlineKeyboardMarkup(inline_keyboard=[
-            [InlineKeyboardButton(text="← Назад к обзору", callback_data="ovr_back")]
-        ])
-        await callback.message.edit_text(text, reply_markup=kb)
-
-    await callback.answer()
+        await callback.message.edit_text(text, reply_markup=overview_back_keyboard())
 
 
 @admin_router.callback_query(F.data.startswith("ovr_tx:"))
@@ -306,30 +356,15 @@ async def ovr_transaction_detail(callback: CallbackQuery) -> None:
     tx_id = int(callback.data.split(":", maxsplit=1)[1])
 
     async with get_session() as session:
-        from app.db.repositories import TransactionRepository
-        from sqlalchemy.orm import joinedload
-        from sqlalchemy import select
-        from app.db.models import Transaction
-        from app.db.session import _session_factory
-
         tx_repo = TransactionRepository(session)
-        # Fetch with user and item eagerly loaded
-        from sqlalchemy.orm import joinedload
-        stmt = (
-            select(Transaction)
-            .where(Transaction.id == tx_id)
-            .options(
-                joinedload(Transaction.user),
-                joinedload(Transaction.item),
-            )
-        )
-        result = await session.execute(stmt)
-        tx = result.scalar_one_or_none()
+        tx = await tx_repo.get_with_user_and_item(tx_id)
 
     if tx is None:
         await callback.answer("❌ Запись не найдена", show_alert=True)
         return
 
+    _answer_early(callback)
+
     action_label = "✋ Взятие" if tx.action.value == "take" else "↩️ Возврат"
     item_name = tx.item.name if tx.item else f"#{tx.item_id}"
     user_name = _user_short(tx.user)
@@ -348,7 +383,6 @@ async def ovr_transaction_detail(callback: CallbackQuery) -> None:
         text,
         reply_markup=tx_photo_keyboard(tx_id=tx.id, item_id=tx.item_id),
     )
-    await callback.answer()
 
 
 @admin_router.callback_query(F.data.startswith("ovr_photo:"))
@@ -356,19 +390,8 @@ async def ovr_show_photo(callback: CallbackQuery) -> None:
     tx_id = int(callback.data.split(":", maxsplit=1)[1])
 
     async with get_session() as session:
-        from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
-        from app.db.models import Transaction
-        stmt = (
-            select(Transaction)
-            .where(Transaction.id == tx_id)
-            .options(
-                joinedload(Transaction.user),
-                joinedload(Transaction.item),
-            )
-        )
-        result = await session.execute(stmt)
-        tx = result.scalar_one_or_none()
+        tx_repo = TransactionRepository(session)
+        tx = await tx_repo.get_photo_details(tx_id)
 
     if tx is None:
         await callback.answer("❌ Запись не найдена", show_alert=True)
@@ -378,9 +401,12 @@ async def ovr_show_photo(callback: CallbackQuery) -> None:
         await callback.answer("📸 Фото отсутствует", show_alert=True)
         return
 
+    _answer_early(callback)
+
     action_label = "✋ Взятие" if tx.action.value == "take" else "↩️ Возврат"
-    item_name = tx.item.name if tx.item else f"#{tx.item_id}"
-    user_name = _user_short(tx.user)
+    item_name = tx.item_name if tx.item_name is not None else f"#{tx.item_id}"
+    # the row carries the user's display columns directly
+    user_name = _user_short(tx if tx.telegram_id is not None else None)
     date_str = _fmt_dt(tx.created_at)
 
     caption = (
@@ -388,17 +414,11 @@ async def ovr_show_photo(callback: CallbackQuery) -> None:
         f"\n👤 {user_name}   📅 {date_str}"
     )
 
-    from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-    back_kb = InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text="← Назад к истории", callback_data=f"ovr_item:{tx.item_id}")]
-    ])
-
-    await callback.message.answer_photo(
+    await _bounded_send(callback.message.answer_photo)(
         photo=tx.photo_file_id,
         caption=caption,
-        reply_markup=back_kb,
+        reply_markup=tx_photo_back_keyboard(tx.item_id),
     )
-    await callback.answer()
 
 
 # ─────────────────────── Search ──────────────────────────────────────────────
@@ -417,7 +437,7 @@ async def admin_search_start(message: Message, state: FSMContext) -> None:
 
 @admin_router.message(AdminSearch.waiting_for_query)
 async def admin_search_process(message: Message, state: FSMContext) -> None:
-    query = message.text.strip() if message.text else ""
+    query = _clean(message.text)
     if not query:
         await message.answer("❌ Запрос не может быть пустым. Попробуйте ещё раз:")
         return
@@ -435,10 +455,11 @@ async def admin_search_process(message: Message, state: FSMContext) -> None:
         await state.clear()
         return
 
-    results = [(it.id, it.name, it.status.value) for it in items]
     await message.answer(
         f"🔎 Результаты поиска по запросу «{query}» ({len(items)}):",
-        reply_markup=admin_search_results_keyboard(results),
+        reply_markup=admin_search_results_keyboard(
+            (it.id, it.name, it.status.value) for it in items
+        ),
     )
     await state.clear()
 
@@ -452,31 +473,30 @@ async def admin_categories_list(message: Message, state: FSMContext) -> None:
     await state.clear()
     async with get_session() as session:
         svc = AdminService(session)
-        categories = await svc.categories.list_all()
+        categories = await svc.categories.list_all_rows()
 
-    data = [(c.id, c.name, c.is_active) for c in categories]
-    if not data:
+    if not categories:
         text = "📂 Категорий ещё нет.\nНажмите ➕, чтобы создать первую."
     else:
-        text = f"📂 <b>Категории</b> ({len(data)} шт.):"
+        text = f"📂 <b>Категории</b> ({len(categories)} шт.):"
 
     await message.answer(
         text,
-        reply_markup=admin_categories_keyboard(data),
+        reply_markup=admin_categories_keyboard(categories),
     )
 
 
 @admin_router.callback_query(F.data == "adm_back:categories")
 async def adm_back_to_categories(callback: CallbackQuery, state: FSMContext) -> None:
+    _answer_early(callback)
     await state.clear()
     async with get_session() as session:
         svc = AdminService(session)
-        categories = await svc.categories.list_all()
+        categories = await svc.categories.list_all_rows()
 
-    data = [(c.id, c.name, c.is_active) for c in categories]
-    text = f"📂 <b>Категории</b> ({len(data)} шт.):" if data else "📂 Категорий пока нет."
-    await callback.message.edit_text(text, reply_markup=admin_categories_keyboard(data))
-    await callback.answer()
+    text = f"📂 <b>Категории</b> ({len(categories)} шт.):" if categories else "📂 Категорий пока нет."
+    kb = admin_categories_keyboard(categories)
+    await callback.message.edit_text(text, reply_markup=kb)
 
 
 # ── Открыть конкретную категорию ─────────────────────────────────────────────
@@ -497,16 +517,13 @@ async def adm_category_detail(callback: CallbackQuery, state: FSMContext) -> Non
     async with get_session() as session:
         svc = AdminService(session)
         cat = await svc.categories.get_by_id(category_id)
+        item_count = await svc.items.count_by_category(category_id) if cat else 0
 
     if cat is None:
         await callback.answer("❌ Категория не найдена", show_alert=True)
         return
 
-    item_count = 0
-    async with get_session() as session:
-        svc = AdminService(session)
-        items = await svc.items.list_by_category(category_id)
-        item_count = len(items)
+    _answer_early(callback)
 
     status_icon = "✅ Активна" if cat.is_active else "🔴 Неактивна"
     text = (
@@ -519,14 +536,13 @@ async def adm_category_detail(callback: CallbackQuery, state: FSMContext) -> Non
         text,
         reply_markup=admin_category_actions_keyboard(category_id, cat.is_active),
     )
-    await callback.answer()
 
 
 # ── Создать категорию ─────────────────────────────────────────────────────────
 
 @admin_router.message(AdminCreateCategory.waiting_for_name)
 async def adm_create_category_name(message: Message, state: FSMContext) -> None:
-    name = message.text.strip() if message.text else ""
+    name = _clean(message.text)
     if not name:
         await message.answer("❌ Название не может быть пустым. Попробуйте ещё раз:")
         return
@@ -534,8 +550,7 @@ async def adm_create_category_name(message: Message, state: FSMContext) -> None:
         await message.answer("❌ Слишком длинное название (макс. 128 символов). Попробуйте короче:")
         return
 
-    await state.update_data(cat_name=name)
-    await state.set_state(AdminCreateCategory.waiting_for_description)
+    await enter_state(state, AdminCreateCategory.waiting_for_description, cat_name=name)
     await message.answer(
         f"✅ Название: <b>{name}</b>\n\n"
         "📝 Введите описание категории (или /skip чтобы пропустить):",
@@ -548,24 +563,21 @@ async def adm_create_category_desc(message: Message, state: FSMContext) -> None:
     data = await state.get_data()
     name = data["cat_name"]
     description = None
-    if message.text and message.text.strip() != "/skip":
-        description = message.text.strip()
+    text = _clean(message.text)
+    if message.text and text != "/skip":
+        description = text
 
-    settings = get_settings()
+    admin = await _require_admin(message)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
         try:
             cat = await svc.create_category(admin=admin, name=name, description=description)
+            # refreshed list comes from the same transaction
+            categories = await svc.categories.list_all_rows()
             await session.commit()
+            list_cache.active_categories.invalidate()
         except Exception as e:
             await state.clear()
             await message.answer(f"❌ Ошибка: {e}")
@@ -576,14 +588,9 @@ async def adm_create_category_desc(message: Message, state: FSMContext) -> None:
         f"✅ Категория <b>{cat.name}</b> успешно создана!\n"
         f"ID: {cat.id}"
     )
-    # refresh list
-    async with get_session() as session:
-        svc = AdminService(session)
-        categories = await svc.categories.list_all()
-    data_list = [(c.id, c.name, c.is_active) for c in categories]
     await message.answer(
-        f"📂 <b>Категории</b> ({len(data_list)} шт.):",
-        reply_markup=admin_categories_keyboard(data_list),
+        f"📂 <b>Категории</b> ({len(categories)} шт.):",
+        reply_markup=admin_categories_keyboard(categories),
     )
 
 
@@ -592,8 +599,7 @@ async def adm_create_category_desc(message: Message, state: FSMContext) -> None:
 @admin_router.callback_query(F.data.startswith("adm_cat_rename:"))
 async def adm_rename_category_start(callback: CallbackQuery, state: FSMContext) -> None:
     category_id = int(callback.data.split(":", maxsplit=1)[1])
-    await state.update_data(category_id=category_id)
-    await state.set_state(AdminEditCategory.waiting_for_new_name)
+    await enter_state(state, AdminEditCategory.waiting_for_new_name, category_id=category_id)
     await callback.message.edit_text(
         "✏️ Введите <b>новое название</b> категории:",
         reply_markup=cancel_keyboard(),
@@ -603,7 +609,7 @@ async def adm_rename_category_start(callback: CallbackQuery, state: FSMContext)
 
 @admin_router.message(AdminEditCategory.waiting_for_new_name)
 async def adm_rename_category_finish(message: Message, state: FSMContext) -> None:
-    new_name = message.text.strip() if message.text else ""
+    new_name = _clean(message.text)
     if not new_name:
         await message.answer("❌ Название не может быть пустым. Попробуйте ещё раз:")
         return
@@ -611,20 +617,14 @@ async def adm_rename_category_finish(message: Message, state: FSMContext) -> Non
     data = await state.get_data()
     category_id = data["category_id"]
 
-    settings = get_settings()
+    admin = await _require_admin(message)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
         ok = await svc.rename_category(admin=admin, category_id=category_id, new_name=new_name)
         await session.commit()
+        list_cache.active_categories.invalidate()
 
     await state.clear()
     if ok:
@@ -638,39 +638,27 @@ async def adm_rename_category_finish(message: Message, state: FSMContext) -> Non
 @admin_router.callback_query(F.data.startswith("adm_cat_deact:"))
 async def adm_deactivate_category(callback: CallbackQuery) -> None:
     category_id = int(callback.data.split(":", maxsplit=1)[1])
-    settings = get_settings()
+    admin = await _require_admin(callback)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=callback.from_user.id,
-            username=callback.from_user.username,
-            first_name=callback.from_user.first_name,
-            last_name=callback.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
-        ok = await svc.deactivate_category(admin=admin, category_id=category_id)
+        # RETURNING gives the updated row, so the detail needs no re-read
+        cat = await svc.deactivate_category(admin=admin, category_id=category_id)
+        if cat is not None:
+            item_count = await svc.items.count_by_category(category_id)
         await session.commit()
+        list_cache.active_categories.invalidate()
 
-    if ok:
+    if cat is not None:
         await callback.answer("🔴 Категория деактивирована", show_alert=False)
-        # refresh detail
-        async with get_session() as session:
-            svc = AdminService(session)
-            cat = await svc.categories.get_by_id(category_id)
-        if cat:
-            items = []
-            async with get_session() as session:
-                svc = AdminService(session)
-                items = await svc.items.list_by_category(category_id)
-            text = (
-                f"<b>📂 {cat.name}</b>\nСтатус: 🔴 Неактивна\nПозиций: {len(items)}"
-            )
-            await callback.message.edit_text(
-                text,
-                reply_markup=admin_category_actions_keyboard(category_id, False),
-            )
+        text = (
+            f"<b>📂 {cat.name}</b>\nСтатус: 🔴 Неактивна\nПозиций: {item_count}"
+        )
+        await callback.message.edit_text(
+            text,
+            reply_markup=admin_category_actions_keyboard(category_id, False),
+        )
     else:
         await callback.answer("❌ Не удалось деактивировать", show_alert=True)
 
@@ -678,35 +666,26 @@ async def adm_deactivate_category(callback: CallbackQuery) -> None:
 @admin_router.callback_query(F.data.startswith("adm_cat_act:"))
 async def adm_activate_category(callback: CallbackQuery) -> None:
     category_id = int(callback.data.split(":", maxsplit=1)[1])
-    settings = get_settings()
+    admin = await _require_admin(callback)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=callback.from_user.id,
-            username=callback.from_user.username,
-            first_name=callback.from_user.first_name,
-            last_name=callback.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
-        ok = await svc.activate_category(admin=admin, category_id=category_id)
+        cat = await svc.activate_category(admin=admin, category_id=category_id)
+        if cat is not None:
+            item_count = await svc.items.count_by_category(category_id)
         await session.commit()
+        list_cache.active_categories.invalidate()
 
-    if ok:
+    if cat is not None:
         await callback.answer("🟢 Категория активирована", show_alert=False)
-        async with get_session() as session:
-            svc = AdminService(session)
-            cat = await svc.categories.get_by_id(category_id)
-            items = await svc.items.list_by_category(category_id)
-        if cat:
-            text = (
-                f"<b>📂 {cat.name}</b>\nСтатус: ✅ Активна\nПозиций: {len(items)}"
-            )
-            await callback.message.edit_text(
-                text,
-                reply_markup=admin_category_actions_keyboard(category_id, True),
-            )
+        text = (
+            f"<b>📂 {cat.name}</b>\nСтатус: ✅ Активна\nПозиций: {item_count}"
+        )
+        await callback.message.edit_text(
+            text,
+            reply_markup=admin_category_actions_keyboard(category_id, True),
+        )
     else:
         await callback.answer("❌ Не удалось активировать", show_alert=True)
 
@@ -731,30 +710,23 @@ async def adm_delete_category_confirm(callback: CallbackQuery) -> None:
 @admin_router.callback_query(F.data.startswith("adm_cat_del_yes:"))
 async def adm_delete_category_execute(callback: CallbackQuery) -> None:
     category_id = int(callback.data.split(":", maxsplit=1)[1])
-    settings = get_settings()
+    admin = await _require_admin(callback)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=callback.from_user.id,
-            username=callback.from_user.username,
-            first_name=callback.from_user.first_name,
-            last_name=callback.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
         ok = await svc.delete_category(admin=admin, category_id=category_id)
+        if ok:
+            categories = await svc.categories.list_all_rows()
         await session.commit()
+        list_cache.active_categories.invalidate()
+        list_cache.drop_category_items(category_id)
 
     if ok:
         await callback.answer("🗑 Категория удалена", show_alert=False)
-        # refresh list
-        async with get_session() as session:
-            svc = AdminService(session)
-            categories = await svc.categories.list_all()
-        data_list = [(c.id, c.name, c.is_active) for c in categories]
-        text = f"📂 <b>Категории</b> ({len(data_list)} шт.):" if data_list else "📂 Категорий пока нет."
-        await callback.message.edit_text(text, reply_markup=admin_categories_keyboard(data_list))
+        text = f"📂 <b>Категории</b> ({len(categories)} шт.):" if categories else "📂 Категорий пока нет."
+        kb = admin_categories_keyboard(categories)
+        await callback.message.edit_text(text, reply_markup=kb)
     else:
         await callback.answer("❌ Не удалось удалить", show_alert=True)
 
@@ -769,17 +741,16 @@ async def admin_items_top(message: Message, state: FSMContext) -> None:
     await state.clear()
     async with get_session() as session:
         svc = AdminService(session)
-        categories = await svc.categories.list_all()
+        categories = await svc.categories.list_all_rows()
 
-    data = [(c.id, c.name, c.is_active) for c in categories]
-    if not data:
+    if not categories:
         await message.answer(
             "📂 Сначала создайте хотя бы одну категорию (раздел «Категории»).",
         )
         return
     await message.answer(
         "📋 Выберите категорию для управления позициями:",
-        reply_markup=admin_categories_keyboard(data),
+        reply_markup=admin_categories_keyboard(categories),
     )
 
 
@@ -789,22 +760,39 @@ async def adm_items_list(callback: CallbackQuery, state: FSMContext) -> None:
     async with get_session() as session:
         svc = AdminService(session)
         cat = await svc.categories.get_by_id(category_id)
-        items = await svc.items.list_by_category(category_id)
+        if cat is not None:
+            rows = await list_cache.category_items(session, category_id)
 
     if cat is None:
         await callback.answer("❌ Категория не найдена", show_alert=True)
         return
 
-    formatted = [(it.id, it.name, it.status.value) for it in items]
-    text = f"📋 <b>{cat.name}</b> — позиции ({len(items)} шт.):"
-    if not items:
+    _answer_early(callback)
+
+    text = f"📋 <b>{cat.name}</b> — позиции ({len(rows)} шт.):"
+    if not rows:
         text += "\n<i>Позиций пока нет.</i>"
 
     await callback.message.edit_text(
         text,
-        reply_markup=admin_items_keyboard(formatted, category_id=category_id),
+        reply_markup=admin_items_keyboard(rows, category_id=category_id),
     )
-    await callback.answer()
+
+
+@functools.lru_cache(maxsize=2048)
+def _render_item_detail(
+    item_id: int,
+    name: str,
+    status: str,
+    inventory_code: str | None,
+    holder_info: str,
+    category_id: int,
+) -> tuple[str, InlineKeyboardMarkup]:
+    """Item card text and keyboard; the key holds every rendered field, so it never goes stale."""
+    code_info = f"\nКод: <code>{inventory_code}</code>" if inventory_code else ""
+    text = format_item_detail(name, status, code_info, holder_info)
+    kb = admin_item_actions_keyboard(item_id=item_id, category_id=category_id, status=status)
+    return text, kb
 
 
 # ── Открыть конкретную позицию ────────────────────────────────────────────────
@@ -820,13 +808,8 @@ async def adm_item_detail(callback: CallbackQuery) -> None:
         await callback.answer("❌ Позиция не найдена", show_alert=True)
         return
 
-    STATUS_LABELS = {
-        "available": "✅ Доступно",
-        "taken": "🔴 Выдано",
-        "lost": "❓ Утеряно",
-        "maintenance": "🔧 На обслуживании",
-    }
-    status_label = STATUS_LABELS.get(item.status.value, item.status.value)
+    _answer_early(callback)
+
     holder_info = ""
     if item.current_holder:
         user = item.current_holder
@@ -836,32 +819,20 @@ async def adm_item_detail(callback: CallbackQuery) -> None:
     elif item.current_holder_id:
         holder_info = f"\nДержатель: ID={item.current_holder_id}"
 
-    code_info = f"\nКод: <code>{item.inventory_code}</code>" if item.inventory_code else ""
-
-    text = (
-        f"<b>📦 {item.name}</b>\n"
-        f"Статус: {status_label}"
-        f"{code_info}"
-        f"{holder_info}"
-    )
-    await callback.message.edit_text(
-        text,
-        reply_markup=admin_item_actions_keyboard(
-            item_id=item.id,
-            category_id=item.category_id,
-            status=item.status.value,
-        ),
+    text, kb = _render_item_detail(
+        item.id, item.name, item.status.value, item.inventory_code, holder_info, item.category_id
     )
-    await callback.answer()
+    await callback.message.edit_text(text, reply_markup=kb)
 
 
 # ── Создать позицию ───────────────────────────────────────────────────────────
 
-@admin_router.callback_query(F.data.startswith("adm_item_create:"))
-async def adm_create_item_start(callback: CallbackQuery, state: FSMContext) -> None:
-    category_id = int(callback.data.split(":", maxsplit=1)[1])
-    await state.update_data(item_category_id=category_id)
-    await state.set_state(AdminCreateItem.waiting_for_name)
+@admin_router.callback_query(AdminItemCreateCB.filter())
+async def adm_create_item_start(
+    callback: CallbackQuery, callback_data: AdminItemCreateCB, state: FSMContext
+) -> None:
+    category_id = callback_data.category_id
+    await enter_state(state, AdminCreateItem.waiting_for_name, item_category_id=category_id)
     await callback.message.edit_text(
         "📝 Введите <b>название</b> новой позиции:",
         reply_markup=cancel_keyboard(),
@@ -871,12 +842,11 @@ async def adm_create_item_start(callback: CallbackQuery, state: FSMContext) -> N
 
 @admin_router.message(AdminCreateItem.waiting_for_name)
 async def adm_create_item_name(message: Message, state: FSMContext) -> None:
-    name = message.text.strip() if message.text else ""
+    name = _clean(message.text)
     if not name:
         await message.answer("❌ Название не может быть пустым:")
         return
-    await state.update_data(item_name=name)
-    await state.set_state(AdminCreateItem.waiting_for_code)
+    await enter_state(state, AdminCreateItem.waiting_for_code, item_name=name)
     await message.answer(
         f"✅ Название: <b>{name}</b>\n\n"
         "🏷 Введите инвентарный номер/код (или /skip чтобы пропустить):",
@@ -890,20 +860,14 @@ async def adm_create_item_code(message: Message, state: FSMContext) -> None:
     name = data["item_name"]
     category_id = data["item_category_id"]
     code = None
-    if message.text and message.text.strip() != "/skip":
-        code = message.text.strip()
+    text = _clean(message.text)
+    if message.text and text != "/skip":
+        code = text
 
-    settings = get_settings()
+    admin = await _require_admin(message)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
         try:
             item = await svc.create_item(
@@ -912,37 +876,35 @@ async def adm_create_item_code(message: Message, state: FSMContext) -> None:
                 name=name,
                 inventory_code=code,
             )
+            cat = await svc.categories.get_by_id(category_id)
             await session.commit()
         except Exception as e:
             await state.clear()
             await message.answer(f"❌ Ошибка: {e}")
             return
+        list_cache.add_category_item(category_id, item.id, item.name, item.status.value)
+        # only queries if this category isn't cached yet
+        rows = await list_cache.category_items(session, category_id)
 
     await state.clear()
     code_info = f" (код: <code>{item.inventory_code}</code>)" if item.inventory_code else ""
     await message.answer(f"✅ Позиция <b>{item.name}</b>{code_info} добавлена!")
 
-    # refresh items list
-    async with get_session() as session:
-        svc = AdminService(session)
-        items = await svc.items.list_by_category(category_id)
-        cat = await svc.categories.get_by_id(category_id)
-
-    formatted = [(it.id, it.name, it.status.value) for it in items]
     cat_name = cat.name if cat else f"#{category_id}"
     await message.answer(
-        f"📋 <b>{cat_name}</b> — позиции ({len(items)} шт.):",
-        reply_markup=admin_items_keyboard(formatted, category_id=category_id),
+        f"📋 <b>{cat_name}</b> — позиции ({len(rows)} шт.):",
+        reply_markup=admin_items_keyboard(rows, category_id=category_id),
     )
 
 
 # ── Переименовать позицию ─────────────────────────────────────────────────────
 
-@admin_router.callback_query(F.data.startswith("adm_item_rename:"))
-async def adm_rename_item_start(callback: CallbackQuery, state: FSMContext) -> None:
-    item_id = int(callback.data.split(":", maxsplit=1)[1])
-    await state.update_data(edit_item_id=item_id)
-    await state.set_state(AdminEditItem.waiting_for_new_name)
+@admin_router.callback_query(AdminItemRenameCB.filter())
+async def adm_rename_item_start(
+    callback: CallbackQuery, callback_data: AdminItemRenameCB, state: FSMContext
+) -> None:
+    item_id = callback_data.item_id
+    await enter_state(state, AdminEditItem.waiting_for_new_name, edit_item_id=item_id)
     await callback.message.edit_text(
         "✏️ Введите <b>новое название</b> позиции:",
         reply_markup=cancel_keyboard(),
@@ -952,7 +914,7 @@ async def adm_rename_item_start(callback: CallbackQuery, state: FSMContext) -> N
 
 @admin_router.message(AdminEditItem.waiting_for_new_name)
 async def adm_rename_item_finish(message: Message, state: FSMContext) -> None:
-    new_name = message.text.strip() if message.text else ""
+    new_name = _clean(message.text)
     if not new_name:
         await message.answer("❌ Название не может быть пустым:")
         return
@@ -960,20 +922,15 @@ async def adm_rename_item_finish(message: Message, state: FSMContext) -> None:
     data = await state.get_data()
     item_id = data["edit_item_id"]
 
-    settings = get_settings()
+    admin = await _require_admin(message)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
         ok = await svc.rename_item(admin=admin, item_id=item_id, new_name=new_name)
         await session.commit()
+    if ok:
+        list_cache.update_category_item(item_id, name=new_name)
 
     await state.clear()
     if ok:
@@ -984,11 +941,12 @@ async def adm_rename_item_finish(message: Message, state: FSMContext) -> None:
 
 # ── Изменить инвентарный код ──────────────────────────────────────────────────
 
-@admin_router.callback_query(F.data.startswith("adm_item_code:"))
-async def adm_item_code_start(callback: CallbackQuery, state: FSMContext) -> None:
-    item_id = int(callback.data.split(":", maxsplit=1)[1])
-    await state.update_data(edit_item_id=item_id)
-    await state.set_state(AdminEditItem.waiting_for_new_code)
+@admin_router.callback_query(AdminItemCodeCB.filter())
+async def adm_item_code_start(
+    callback: CallbackQuery, callback_data: AdminItemCodeCB, state: FSMContext
+) -> None:
+    item_id = callback_data.item_id
+    await enter_state(state, AdminEditItem.waiting_for_new_code, edit_item_id=item_id)
     await callback.message.edit_text(
         "🏷 Введите новый <b>инвентарный код</b> (или /skip чтобы сбросить):",
         reply_markup=cancel_keyboard(),
@@ -998,23 +956,16 @@ async def adm_item_code_start(callback: CallbackQuery, state: FSMContext) -> Non
 
 @admin_router.message(AdminEditItem.waiting_for_new_code)
 async def adm_item_code_finish(message: Message, state: FSMContext) -> None:
-    text = message.text.strip() if message.text else ""
+    text = _clean(message.text)
     new_code = "" if text == "/skip" else text
 
     data = await state.get_data()
     item_id = data["edit_item_id"]
 
-    settings = get_settings()
+    admin = await _require_admin(message)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
         ok = await svc.update_item_code(admin=admin, item_id=item_id, new_code=new_code or "")
         await session.commit()
@@ -1031,74 +982,45 @@ async def adm_item_code_finish(message: Message, state: FSMContext) -> None:
 
 # ── Изменить статус позиции ───────────────────────────────────────────────────
 
-@admin_router.callback_query(F.data.startswith("adm_item_status:"))
-async def adm_item_set_status(callback: CallbackQuery) -> None:
-    # adm_item_status:{item_id}:{status_key}
-    parts = callback.data.split(":")
-    item_id = int(parts[1])
-    status_key = parts[2]
-
-    STATUS_MAP = {
-        "available": ItemStatus.AVAILABLE,
-        "taken": ItemStatus.TAKEN,
-        "lost": ItemStatus.LOST,
-        "maintenance": ItemStatus.MAINTENANCE,
-    }
-    new_status = STATUS_MAP.get(status_key)
-    if new_status is None:
-        await callback.answer("❌ Неверный статус", show_alert=True)
-        return
+@admin_router.callback_query(AdminItemStatusCB.filter())
+async def adm_item_set_status(callback: CallbackQuery, callback_data: AdminItemStatusCB) -> None:
+    item_id = callback_data.item_id
+    # the filter already parsed and validated the status against ItemStatus
+    new_status = callback_data.status
 
-    settings = get_settings()
+    admin = await _require_admin(callback)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=callback.from_user.id,
-            username=callback.from_user.username,
-            first_name=callback.from_user.first_name,
-            last_name=callback.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
-        ok = await svc.set_item_status(admin=admin, item_id=item_id, status=new_status)
+        # the UPDATE returns the row, so nothing needs re-reading for the card
+        item = await svc.set_item_status(admin=admin, item_id=item_id, status=new_status)
         await session.commit()
 
-    if ok:
-        STATUS_LABELS = {
-            "available": "✅ Доступно",
-            "taken": "🔴 Выдано",
-            "lost": "❓ Утеряно",
-            "maintenance": "🔧 На обслуживании",
-        }
-        await callback.answer(f"Статус изменён → {STATUS_LABELS.get(status_key, status_key)}")
-        # refresh item detail
-        async with get_session() as session:
-            svc = AdminService(session)
-            item = await svc.items.get_by_id(item_id)
-        if item:
-            text = (
-                f"<b>📦 {item.name}</b>\n"
-                f"Статус: {STATUS_LABELS.get(item.status.value, '')}"
-                + (f"\nКод: <code>{item.inventory_code}</code>" if item.inventory_code else "")
-            )
-            await callback.message.edit_text(
-                text,
-                reply_markup=admin_item_actions_keyboard(
-                    item_id=item.id,
-                    category_id=item.category_id,
-                    status=item.status.value,
-                ),
-            )
+    if item is not None:
+        list_cache.update_category_item(item_id, status=new_status.value)
+        await callback.answer(f"Статус изменён → {STATUS_LABELS[new_status.value]}")
+        text, kb = _render_item_detail(
+            item.id, item.name, item.status.value, item.inventory_code, "", item.category_id
+        )
+        await edit_message(callback, text, kb)
     else:
         await callback.answer("❌ Позиция не найдена", show_alert=True)
 
 
+@admin_router.callback_query(F.data.startswith("adm_item_status:"))
+async def adm_item_set_status_invalid(callback: CallbackQuery) -> None:
+    # only reached when AdminItemStatusCB rejected the payload
+    await callback.answer("❌ Неверный статус", show_alert=True)
+
+
 # ── Удалить позицию ───────────────────────────────────────────────────────────
 
-@admin_router.callback_query(F.data.startswith("adm_item_del:"))
-async def adm_delete_item_confirm(callback: CallbackQuery) -> None:
-    item_id = int(callback.data.split(":", maxsplit=1)[1])
+@admin_router.callback_query(AdminItemDeleteCB.filter())
+async def adm_delete_item_confirm(
+    callback: CallbackQuery, callback_data: AdminItemDeleteCB
+) -> None:
+    item_id = callback_data.item_id
     async with get_session() as session:
         svc = AdminService(session)
         item = await svc.items.get_by_id(item_id)
@@ -1114,79 +1036,68 @@ async def adm_delete_item_confirm(callback: CallbackQuery) -> None:
     await callback.answer()
 
 
-@admin_router.callback_query(F.data.startswith("adm_item_del_yes:"))
-async def adm_delete_item_execute(callback: CallbackQuery) -> None:
-    parts = callback.data.split(":")
-    item_id = int(parts[1])
-    category_id = int(parts[2])
+@admin_router.callback_query(AdminItemDeleteConfirmCB.filter())
+async def adm_delete_item_execute(
+    callback: CallbackQuery, callback_data: AdminItemDeleteConfirmCB
+) -> None:
+    item_id = callback_data.item_id
+    category_id = callback_data.category_id
 
-    settings = get_settings()
+    admin = await _require_admin(callback)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=callback.from_user.id,
-            username=callback.from_user.username,
-            first_name=callback.from_user.first_name,
-            last_name=callback.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
         ok = await svc.delete_item(admin=admin, item_id=item_id)
+        if ok:
+            cat = await svc.categories.get_by_id(category_id)
         await session.commit()
+        if ok:
+            list_cache.remove_category_item(category_id, item_id)
+            rows = await list_cache.category_items(session, category_id)
 
     if ok:
         await callback.answer("🗑 Позиция удалена", show_alert=False)
-        # refresh items list
-        async with get_session() as session:
-            svc = AdminService(session)
-            items = await svc.items.list_by_category(category_id)
-            cat = await svc.categories.get_by_id(category_id)
-
-        formatted = [(it.id, it.name, it.status.value) for it in items]
         cat_name = cat.name if cat else f"#{category_id}"
-        text = f"📋 <b>{cat_name}</b> — позиции ({len(items)} шт.):"
-        if not items:
+        text = f"📋 <b>{cat_name}</b> — позиции ({len(rows)} шт.):"
+        if not rows:
             text += "\n<i>Позиций пока нет.</i>"
-        await callback.message.edit_text(
-            text,
-            reply_markup=admin_items_keyboard(formatted, category_id=category_id),
-        )
+        await edit_message(callback, text, admin_items_keyboard(rows, category_id=category_id))
     else:
         await callback.answer("❌ Не удалось удалить", show_alert=True)
 
 
 # ══════════════════════ USERS MANAGEMENT ════════════════════════════════════
 
+@async_cached(ttl=60)
+async def _user_rows() -> tuple[tuple[int, str, bool], ...]:
+    """(id, display, is_admin) for the users list; new users show up after the TTL."""
+    async with get_session() as session:
+        users = await UserRepository(session).list_all()
+    return tuple((u.id, _user_display(u), u.is_admin) for u in users)
+
+
 @admin_router.message(F.text == "👥 Пользователи")
 async def admin_users_list(message: Message) -> None:
     if not await _require_admin(message):
         return
 
-    async with get_session() as session:
-        svc = AdminService(session)
-        users = await svc.users.list_all()
-
-    data = [(u.id, _user_display(u), u.is_admin) for u in users]
+    data = await _user_rows()
     text = f"👥 <b>Пользователи</b> ({len(data)} чел.):"
     await message.answer(text, reply_markup=admin_users_keyboard(data))
 
 
 @admin_router.callback_query(F.data == "adm_back:users")
 async def adm_back_to_users(callback: CallbackQuery) -> None:
-    async with get_session() as session:
-        svc = AdminService(session)
-        users = await svc.users.list_all()
-
-    data = [(u.id, _user_display(u), u.is_admin) for u in users]
+    data = await _user_rows()
     text = f"👥 <b>Пользователи</b> ({len(data)} чел.):"
-    await callback.message.edit_text(text, reply_markup=admin_users_keyboard(data))
+    await edit_message(callback, text, admin_users_keyboard(data))
     await callback.answer()
 
 
-@admin_router.callback_query(F.data.startswith("adm_user:"))
-async def adm_user_detail(callback: CallbackQuery) -> None:
-    user_id = int(callback.data.split(":", maxsplit=1)[1])
+@admin_router.callback_query(AdminUserCB.filter())
+async def adm_user_detail(callback: CallbackQuery, callback_data: AdminUserCB) -> None:
+    user_id = callback_data.user_id
     async with get_session() as session:
         svc = AdminService(session)
         user = await svc.users.get_by_id(user_id)
@@ -1208,23 +1119,21 @@ async def adm_user_detail(callback: CallbackQuery) -> None:
     await callback.answer()
 
 
-@admin_router.callback_query(F.data.startswith("adm_user_toggle:"))
-async def adm_toggle_admin(callback: CallbackQuery) -> None:
-    target_user_id = int(callback.data.split(":", maxsplit=1)[1])
-    settings = get_settings()
+@admin_router.callback_query(AdminUserToggleCB.filter())
+async def adm_toggle_admin(callback: CallbackQuery, callback_data: AdminUserToggleCB) -> None:
+    target_user_id = callback_data.user_id
+    admin = await _require_admin(callback)
+    if admin is None:
+        return
     async with get_session() as session:
-        inv = InventoryService(session)
-        admin = await inv.ensure_user(
-            telegram_id=callback.from_user.id,
-            username=callback.from_user.username,
-            first_name=callback.from_user.first_name,
-            last_name=callback.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         svc = AdminService(session)
         new_value = await svc.toggle_admin(admin=admin, target_user_id=target_user_id)
+        # toggle_admin loaded the user, so this is an identity-map hit
+        user = await svc.users.get_by_id(target_user_id) if new_value is not None else None
         await session.commit()
+    if new_value is not None:
+        _user_rows.invalidate()
+        list_cache.admin_chat_ids.invalidate()
 
     if new_value is None:
         await callback.answer("❌ Пользователь не найден", show_alert=True)
@@ -1233,12 +1142,8 @@ async def adm_toggle_admin(callback: CallbackQuery) -> None:
     label = "👑 Назначен администратором" if new_value else "👤 Права администратора сняты"
     await callback.answer(label, show_alert=False)
 
-    # refresh user detail
-    async with get_session() as session:
-        svc = AdminService(session)
-        user = await svc.users.get_by_id(target_user_id)
-
     if user:
+        user_cache.invalidate(user.telegram_id)
         role = "👑 Администратор" if user.is_admin else "👤 Пользователь"
         text = (
             f"<b>{_user_display(user)}</b>\n"
@@ -1319,21 +1224,13 @@ async def admin_resolve_problem_cmd(message: Message) -> None:
     except (IndexError, ValueError):
         return
 
-    async with get_session() as session:
-        inv_svc = InventoryService(session)
-        user = await inv_svc.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=get_settings().initial_admin_ids,
-            initial_admin_usernames=get_settings().initial_admin_usernames,
-        )
-        if not user.is_admin:
-            return
+    admin = await _require_admin(message)
+    if admin is None:
+        return
 
+    async with get_session() as session:
         svc = AdminService(session)
-        ok = await svc.resolve_problem(user, report_id)
+        ok = await svc.resolve_problem(admin, report_id)
         if ok:
             await session.commit()
             await message.answer(f"✅ Жалоба #{report_id} отмечена как решенная.")
@@ -1355,8 +1252,7 @@ async def admin_user_msg_start(callback: CallbackQuery, state: FSMContext) -> No
         await callback.answer("❌ Пользователь не найден", show_alert=True)
         return
 
-    await state.update_data(target_user_id=target_user_id)
-    await state.set_state(AdminMessagingStates.waiting_for_text)
+    await enter_state(state, AdminMessagingStates.waiting_for_text, target_user_id=target_user_id)
     await callback.message.answer(
         f"✉️ <b>Отправка сообщения пользователю {user.first_name}:</b>\n\n"
         "Введите текст сообщения. Пользователь сможет ответить на него.",
@@ -1375,16 +1271,11 @@ async def admin_user_msg_send(message: Message, state: FSMContext) -> None:
         await message.answer("⚠️ Сообщение не может быть пустым.")
         return
 
+    admin = await _require_admin(message)
+    if admin is None:
+        return
+
     async with get_session() as session:
-        inv_svc = InventoryService(session)
-        admin = await inv_svc.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=get_settings().initial_admin_ids,
-            initial_admin_usernames=get_settings().initial_admin_usernames,
-        )
         svc = AdminService(session)
         target_user = await svc.users.get_by_id(target_user_id)
 
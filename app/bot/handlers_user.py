@@ -1,41 +1,43 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message, PhotoSize
 
+from app.bot import list_cache, user_cache
+from app.bot.callbacks import BackToItemsCB, CategoryCB, ItemCB, ReturnCB, TakeCB
+from app.bot.edit import edit_message
 from app.bot.keyboards import (
+    back_to_categories_keyboard,
     cancel_keyboard,
     categories_keyboard,
     item_actions_keyboard,
     items_keyboard,
     main_menu_keyboard,
 )
-from app.bot.states import ProblemReportStates, ReturnItemStates, TakeItemStates, UserReplyStates
-from app.config import get_settings
+from app.bot.notify_queue import NotifyJob, NotifyQueue
+from app.bot.states import (
+    ProblemReportStates,
+    ReturnItemStates,
+    TakeItemStates,
+    UserReplyStates,
+    enter_state,
+)
+from app.bot.texts import format_item_detail
 from app.core.admin_service import AdminService
 from app.core.inventory_service import InventoryService
 from app.db.models import ItemStatus
+from app.db.repositories import ItemRepository
 from app.db.session import get_session
 
 
 user_router = Router()
 
-
-async def _ensure_user(from_user):
-    settings = get_settings()
-    async with get_session() as session:
-        service = InventoryService(session)
-        user = await service.ensure_user(
-            telegram_id=from_user.id,
-            username=from_user.username,
-            first_name=from_user.first_name,
-            last_name=from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
-        await session.commit()
-    return user
+def _largest_photo(message: Message) -> PhotoSize:
+    # Telegram lists sizes smallest-first today; pick by resolution so we don't depend on it
+    return max(message.photo, key=lambda p: p.width * p.height)
 
 
 # ────────────────────────── /start ──────────────────────────────────────────
@@ -43,7 +45,7 @@ async def _ensure_user(from_user):
 @user_router.message(F.text == "/start")
 async def cmd_start(message: Message, state: FSMContext) -> None:
     await state.clear()
-    user = await _ensure_user(message.from_user)
+    user = await user_cache.get_user(message.from_user)
     name = message.from_user.first_name or "!"
     await message.answer(
         f"👋 Привет, {name}!\n\nЯ помогу вам управлять инвентарём.\n"
@@ -56,9 +58,7 @@ async def cmd_start(message: Message, state: FSMContext) -> None:
 
 @user_router.message(F.text == "📦 Оборудование")
 async def show_categories(message: Message) -> None:
-    async with get_session() as session:
-        service = InventoryService(session)
-        categories = await service.list_categories()
+    categories = await list_cache.active_categories()
 
     if not categories:
         await message.answer(
@@ -66,10 +66,9 @@ async def show_categories(message: Message) -> None:
         )
         return
 
-    data = [(c.id, c.name) for c in categories]
     await message.answer(
         "📂 Выберите категорию:",
-        reply_markup=categories_keyboard(data),
+        reply_markup=categories_keyboard(categories),
     )
 
 
@@ -77,175 +76,150 @@ async def show_categories(message: Message) -> None:
 
 @user_router.message(F.text == "🎒 Мои позиции")
 async def my_items(message: Message) -> None:
-    settings = get_settings()
+    user = await user_cache.get_user(message.from_user)
     async with get_session() as session:
-        service = InventoryService(session)
-        user = await service.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
-        items = await service.list_items_for_user(user.id)
+        items = await ItemRepository(session).list_rows_for_holder(user.id)
 
     if not items:
         await message.answer("🎒 У вас нет выданных позиций.")
         return
 
-    formatted = [(item.id, item.name, "taken") for item in items]
     await message.answer(
         f"🎒 Ваши позиции ({len(items)} шт.):",
-        reply_markup=items_keyboard(formatted, show_back=False),
+        reply_markup=items_keyboard(((item_id, name, "taken") for item_id, name in items), show_back=False),
     )
 
 
 # ─────────────────────── Category selected ───────────────────────────────────
 
-@user_router.callback_query(F.data.startswith("cat:"))
-async def on_category_selected(callback: CallbackQuery) -> None:
-    category_id = int(callback.data.split(":", maxsplit=1)[1])
+@user_router.callback_query(CategoryCB.filter())
+async def on_category_selected(callback: CallbackQuery, callback_data: CategoryCB) -> None:
+    category_id = callback_data.category_id
     async with get_session() as session:
-        service = InventoryService(session)
-        items = await service.list_items_for_category(category_id)
+        items = await list_cache.category_items(session, category_id)
 
     if not items:
-        await callback.message.edit_text(
+        await edit_message(
+            callback,
             "📦 В этой категории пока нет позиций.\n",
-            reply_markup=__back_to_cats_kb(),
+            back_to_categories_keyboard(),
         )
         await callback.answer()
         return
 
-    formatted = [(item.id, item.name, item.status.value) for item in items]
-    await callback.message.edit_text(
+    await edit_message(
+        callback,
         f"📦 Выберите позицию ({len(items)} шт.):",
-        reply_markup=items_keyboard(formatted),
+        items_keyboard(items),
     )
     await callback.answer()
 
 
-def __back_to_cats_kb():
-    from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
-    return InlineKeyboardMarkup(
-        inline_keyboard=[
-            [InlineKeyboardButton(text="← К категориям", callback_data="back:categories")]
-        ]
-    )
-
-
 @user_router.callback_query(F.data == "back:categories")
 async def back_to_categories(callback: CallbackQuery) -> None:
-    async with get_session() as session:
-        service = InventoryService(session)
-        categories = await service.list_categories()
+    categories = await list_cache.active_categories()
 
     if not categories:
-        await callback.message.edit_text(
-            "📂 Категорий пока нет. Обратитесь к администратору."
-        )
+        await edit_message(callback, "📂 Категорий пока нет. Обратитесь к администратору.")
         await callback.answer()
         return
 
-    data = [(c.id, c.name) for c in categories]
-    await callback.message.edit_text(
-        "📂 Выберите категорию:",
-        reply_markup=categories_keyboard(data),
-    )
+    await edit_message(callback, "📂 Выберите категорию:", categories_keyboard(categories))
     await callback.answer()
 
 
 # ─────────────────────── Item selected ───────────────────────────────────────
 
-@user_router.callback_query(F.data.startswith("item:"))
-async def on_item_selected(callback: CallbackQuery) -> None:
-    item_id = int(callback.data.split(":", maxsplit=1)[1])
-    settings = get_settings()
+@lru_cache(maxsize=2048)
+def _render_item_detail(
+    item_id: int,
+    name: str,
+    status: str,
+    inventory_code: str | None,
+    holder_name: str | None,
+    can_take: bool,
+    can_return: bool,
+    category_id: int,
+) -> tuple[str, InlineKeyboardMarkup]:
+    """Item card text and keyboard; the key holds every rendered field, so it never goes stale."""
+    code_info = f"\nИнв. код: <code>{inventory_code}</code>" if inventory_code else ""
+    holder_info = f"\n📦 Сейчас у: {holder_name}" if holder_name else ""
+    text = format_item_detail(name, status, code_info, holder_info)
+    kb = item_actions_keyboard(
+        item_id=item_id,
+        can_take=can_take,
+        can_return=can_return,
+        category_id=category_id,
+    )
+    return text, kb
+
+
+@user_router.callback_query(ItemCB.filter())
+async def on_item_selected(callback: CallbackQuery, callback_data: ItemCB) -> None:
+    item_id = callback_data.item_id
+    user = await user_cache.get_user(callback.from_user)
     async with get_session() as session:
         service = InventoryService(session)
-        user = await service.ensure_user(
-            telegram_id=callback.from_user.id,
-            username=callback.from_user.username,
-            first_name=callback.from_user.first_name,
-            last_name=callback.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         item = await service.items.get_by_id(item_id)
 
     if item is None:
         await callback.answer("❌ Позиция не найдена", show_alert=True)
         return
 
-    can_take = item.status == ItemStatus.AVAILABLE
-    can_return = item.status == ItemStatus.TAKEN and item.current_holder_id == user.id
-
-    STATUS_LABELS = {
-        "available": "✅ Доступно",
-        "taken": "🔴 Выдано",
-        "lost": "❓ Утеряно",
-        "maintenance": "🔧 На обслуживании",
-    }
-    code_info = f"\nИнв. код: <code>{item.inventory_code}</code>" if item.inventory_code else ""
-    holder_info = ""
-    if item.status == ItemStatus.TAKEN and item.current_holder:
+    can_take = item.status is ItemStatus.AVAILABLE
+    can_return = item.status is ItemStatus.TAKEN and item.current_holder_id == user.id
+
+    holder_name = None
+    if item.status is ItemStatus.TAKEN and item.current_holder:
         user_holder = item.current_holder
-        name_str = f"{user_holder.first_name} {user_holder.last_name or ''}".strip()
-        holder_info = f"\n📦 Сейчас у: {name_str}"
-
-    text = (
-        f"<b>📦 {item.name}</b>\n"
-        f"Статус: {STATUS_LABELS.get(item.status.value, item.status.value)}"
-        f"{code_info}"
-        f"{holder_info}"
-    )
-    await callback.message.edit_text(
-        text,
-        reply_markup=item_actions_keyboard(
-            item_id=item.id,
-            can_take=can_take,
-            can_return=can_return,
-            category_id=item.category_id,
-        ),
+        holder_name = f"{user_holder.first_name} {user_holder.last_name or ''}".strip()
+
+    text, kb = _render_item_detail(
+        item.id,
+        item.name,
+        item.status.value,
+        item.inventory_code,
+        holder_name,
+        can_take,
+        can_return,
+        item.category_id,
     )
+    await callback.message.edit_text(text, reply_markup=kb)
     await callback.answer()
 
 
-@user_router.callback_query(F.data.startswith("back:items:"))
-async def back_to_items(callback: CallbackQuery) -> None:
-    item_id = int(callback.data.split(":", maxsplit=2)[2])
+@user_router.callback_query(BackToItemsCB.filter())
+async def back_to_items(callback: CallbackQuery, callback_data: BackToItemsCB) -> None:
+    item_id = callback_data.item_id
     async with get_session() as session:
         service = InventoryService(session)
         item = await service.items.get_by_id(item_id)
         if item is None:
             await callback.answer("❌ Позиция не найдена", show_alert=True)
             return
-        items = await service.list_items_for_category(item.category_id)
+        items = await list_cache.category_items(session, item.category_id)
 
     if not items:
         await callback.message.edit_text(
             "📦 Позиций нет.",
-            reply_markup=__back_to_cats_kb(),
+            reply_markup=back_to_categories_keyboard(),
         )
         await callback.answer()
         return
 
-    formatted = [(it.id, it.name, it.status.value) for it in items]
     await callback.message.edit_text(
         f"📦 Выберите позицию ({len(items)} шт.):",
-        reply_markup=items_keyboard(formatted),
+        reply_markup=items_keyboard(items),
     )
     await callback.answer()
 
 
 # ─────────────────────── Take item ───────────────────────────────────────────
 
-@user_router.callback_query(F.data.startswith("take:"))
-async def start_take_item(callback: CallbackQuery, state: FSMContext) -> None:
-    item_id = int(callback.data.split(":", maxsplit=1)[1])
-    await state.update_data(item_id=item_id)
-    await state.set_state(TakeItemStates.waiting_for_photo)
+@user_router.callback_query(TakeCB.filter())
+async def start_take_item(callback: CallbackQuery, callback_data: TakeCB, state: FSMContext) -> None:
+    item_id = callback_data.item_id
+    await enter_state(state, TakeItemStates.waiting_for_photo, item_id=item_id)
     await callback.message.edit_text(
         "📸 Отправьте фото позиции для подтверждения получения.\n"
         "<i>Нажмите «Отменить» чтобы отказаться.</i>",
@@ -255,7 +229,9 @@ async def start_take_item(callback: CallbackQuery, state: FSMContext) -> None:
 
 
 @user_router.message(TakeItemStates.waiting_for_photo, F.photo)
-async def receive_take_photo(message: Message, state: FSMContext) -> None:
+async def receive_take_photo(
+    message: Message, state: FSMContext, notify_queue: NotifyQueue
+) -> None:
     data = await state.get_data()
     item_id = data.get("item_id")
     if item_id is None:
@@ -263,20 +239,12 @@ async def receive_take_photo(message: Message, state: FSMContext) -> None:
         await state.clear()
         return
 
-    photo = message.photo[-1]
-    settings = get_settings()
+    photo = _largest_photo(message)
+    user = await user_cache.get_user(message.from_user)
     async with get_session() as session:
         service = InventoryService(session)
-        user = await service.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         try:
-            await service.take_item(
+            item = await service.take_item(
                 item_id=item_id,
                 user=user,
                 photo_file_id=photo.file_id,
@@ -286,16 +254,19 @@ async def receive_take_photo(message: Message, state: FSMContext) -> None:
             await state.clear()
             return
 
-        # Notify admins
-        item = await service.items.get_by_id(item_id)
-        admin_svc = AdminService(session)
-        user_display = message.from_user.full_name or message.from_user.username or f"ID {message.from_user.id}"
-        await admin_svc.notify_admins(
-            bot=message.bot,
+        await session.commit()
+    list_cache.update_category_item(item_id, status=ItemStatus.TAKEN.value)
+    admin_ids = await list_cache.admin_chat_ids()
+
+    # delivered in the background after commit; the user's reply doesn't wait on it
+    user_display = message.from_user.full_name or message.from_user.username or f"ID {message.from_user.id}"
+    notify_queue.put_nowait(
+        NotifyJob(
+            chat_ids=tuple(admin_ids),
             text=f"✋ <b>Позиция взята</b>\n\n📦 Предмет: {item.name}\n👤 Кто: {user_display}",
             photo=photo.file_id,
         )
-        await session.commit()
+    )
 
     await state.clear()
     user_name = message.from_user.first_name or "Вы"
@@ -313,11 +284,10 @@ async def expect_photo_for_take(message: Message) -> None:
 
 # ─────────────────────── Return item ─────────────────────────────────────────
 
-@user_router.callback_query(F.data.startswith("return:"))
-async def start_return_item(callback: CallbackQuery, state: FSMContext) -> None:
-    item_id = int(callback.data.split(":", maxsplit=1)[1])
-    await state.update_data(item_id=item_id)
-    await state.set_state(ReturnItemStates.waiting_for_photo)
+@user_router.callback_query(ReturnCB.filter())
+async def start_return_item(callback: CallbackQuery, callback_data: ReturnCB, state: FSMContext) -> None:
+    item_id = callback_data.item_id
+    await enter_state(state, ReturnItemStates.waiting_for_photo, item_id=item_id)
     await callback.message.edit_text(
         "📸 Отправьте фото позиции для подтверждения возврата.\n"
         "<i>Нажмите «Отменить» чтобы отказаться.</i>",
@@ -327,7 +297,9 @@ async def start_return_item(callback: CallbackQuery, state: FSMContext) -> None:
 
 
 @user_router.message(ReturnItemStates.waiting_for_photo, F.photo)
-async def receive_return_photo(message: Message, state: FSMContext) -> None:
+async def receive_return_photo(
+    message: Message, state: FSMContext, notify_queue: NotifyQueue
+) -> None:
     data = await state.get_data()
     item_id = data.get("item_id")
     if item_id is None:
@@ -335,20 +307,12 @@ async def receive_return_photo(message: Message, state: FSMContext) -> None:
         await state.clear()
         return
 
-    photo = message.photo[-1]
-    settings = get_settings()
+    photo = _largest_photo(message)
+    user = await user_cache.get_user(message.from_user)
     async with get_session() as session:
         service = InventoryService(session)
-        user = await service.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=settings.initial_admin_ids,
-            initial_admin_usernames=settings.initial_admin_usernames,
-        )
         try:
-            await service.return_item(
+            item = await service.return_item(
                 item_id=item_id,
                 user=user,
                 photo_file_id=photo.file_id,
@@ -358,16 +322,19 @@ async def receive_return_photo(message: Message, state: FSMContext) -> None:
             await state.clear()
             return
 
-        # Notify admins
-        item = await service.items.get_by_id(item_id)
-        admin_svc = AdminService(session)
-        user_display = message.from_user.full_name or message.from_user.username or f"ID {message.from_user.id}"
-        await admin_svc.notify_admins(
-            bot=message.bot,
+        await session.commit()
+    list_cache.update_category_item(item_id, status=ItemStatus.AVAILABLE.value)
+    admin_ids = await list_cache.admin_chat_ids()
+
+    # delivered in the background after commit; the user's reply doesn't wait on it
+    user_display = message.from_user.full_name or message.from_user.username or f"ID {message.from_user.id}"
+    notify_queue.put_nowait(
+        NotifyJob(
+            chat_ids=tuple(admin_ids),
             text=f"↩️ <b>Позиция возвращена</b>\n\n📦 Предмет: {item.name}\n👤 Кто: {user_display}",
             photo=photo.file_id,
         )
-        await session.commit()
+    )
 
     await state.clear()
     user_name = message.from_user.first_name or "Вы"
@@ -397,8 +364,7 @@ async def user_cancel(callback: CallbackQuery, state: FSMContext) -> None:
 @user_router.callback_query(F.data.startswith("report_prob:"))
 async def user_report_problem_start(callback: CallbackQuery, state: FSMContext) -> None:
     item_id = int(callback.data.split(":")[1])
-    await state.update_data(item_id=item_id)
-    await state.set_state(ProblemReportStates.waiting_for_description)
+    await enter_state(state, ProblemReportStates.waiting_for_description, item_id=item_id)
     await callback.message.answer(
         "📝 Пожалуйста, опишите проблему с оборудованием.\n"
         "Ваше сообщение будет передано администраторам.",
@@ -421,17 +387,10 @@ async def user_report_problem_submit(message: Message, state: FSMContext) -> Non
         await message.answer("⚠️ Описание не может быть пустым.")
         return
 
+    user = await user_cache.get_user(message.from_user)
     async with get_session() as session:
         inv_svc = InventoryService(session)
         adm_svc = AdminService(session)
-        user = await inv_svc.ensure_user(
-            telegram_id=message.from_user.id,
-            username=message.from_user.username,
-            first_name=message.from_user.first_name,
-            last_name=message.from_user.last_name,
-            initial_admin_ids=get_settings().initial_admin_ids,
-            initial_admin_usernames=get_settings().initial_admin_usernames,
-        )
         await inv_svc.report_problem(item_id, user, description)
         item = await inv_svc.items.get_by_id(item_id)
         await session.commit()
@@ -471,7 +430,7 @@ async def user_reply_adm_submit(message: Message, state: FSMContext) -> None:
         await message.answer("⚠️ Пожалуйста, введите текстовое сообщение.")
         return
 
-    user = await _ensure_user(message.from_user)
+    user = await user_cache.get_user(message.from_user)
     user_name = f"{user.first_name} (@{user.username})" if user.username else user.first_name
 
     async with get_session() as session:
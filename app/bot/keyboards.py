@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import lru_cache, wraps
+from typing import Final
+
 from aiogram.types import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
@@ -7,9 +11,94 @@ from aiogram.types import (
     ReplyKeyboardMarkup,
 )
 
+from app.bot.callbacks import (
+    AdminItemCodeCB,
+    AdminItemCreateCB,
+    AdminItemDeleteCB,
+    AdminItemDeleteConfirmCB,
+    AdminItemRenameCB,
+    AdminItemStatusCB,
+    AdminUserCB,
+    AdminUserToggleCB,
+    BackToItemsCB,
+    CategoryCB,
+    ItemCB,
+    ReturnCB,
+    TakeCB,
+    packed_prefix,
+)
+from app.bot.markup_session import mark_reusable
+
+
+_STATUS_EMOJI: Final = {
+    "available": "✅",
+    "taken": "🔴",
+    "lost": "❓",
+    "maintenance": "🔧",
+}
+
+# list rows pack a single id, so the prefix is computed once
+_CATEGORY_DATA: Final = packed_prefix(CategoryCB)
+_ITEM_DATA: Final = packed_prefix(ItemCB)
+_ADMIN_USER_DATA: Final = packed_prefix(AdminUserCB)
+
+# "→ status" buttons on the admin item card, in display order
+_STATUS_CHOICES: Final = (
+    ("available", "→ ✅ Доступно"),
+    ("taken", "→ 🔴 Выдано"),
+    ("maintenance", "→ 🔧 На обслуживании"),
+    ("lost", "→ ❓ Утеряно"),
+)
+
+
+# Static trailing rows, shared by every markup that ends with them.
+# Markups are only serialized, never mutated, so one list per row is enough.
+_BACK_TO_CATEGORIES_ROW: Final = [
+    InlineKeyboardButton(text="← Назад к категориям", callback_data="back:categories")
+]
+_TO_CATEGORIES_ROW: Final = [
+    InlineKeyboardButton(text="← К категориям", callback_data="back:categories")
+]
+_CREATE_CATEGORY_ROW: Final = [
+    InlineKeyboardButton(text="➕ Создать категорию", callback_data="adm_cat:create")
+]
+_OVERVIEW_AVAILABLE_ROW: Final = [
+    InlineKeyboardButton(text="✅ Доступные позиции", callback_data="ovr_available")
+]
+_BACK_TO_OVERVIEW_ROW: Final = [
+    InlineKeyboardButton(text="← Назад к обзору", callback_data="ovr_back")
+]
+_SEARCH_BACK_ROW: Final = [InlineKeyboardButton(text="← Назад", callback_data="adm_cancel")]
+
+
+def _memoized(maxsize: int | None):
+    """
+    lru_cache for markup builders. Each built markup is also registered with
+    MarkupCachingSession, since the same object will be sent again.
+    """
+    def decorator(fn):
+        @lru_cache(maxsize=maxsize)
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            return mark_reusable(fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def _list_markup(rows: list[list[InlineKeyboardButton]]) -> InlineKeyboardMarkup:
+    """
+    Wrap already-built button rows without re-validating each of them.
+    Buttons themselves keep the normal constructor: model_construct
+    measured slower there, since it fills every optional field in Python.
+    """
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=rows)
+
 
 # ─────────────────────────── Reply keyboards ────────────────────────────────
 
+@_memoized(maxsize=None)
 def main_menu_keyboard(is_admin: bool) -> ReplyKeyboardMarkup:
     buttons = [
         [KeyboardButton(text="📦 Оборудование")],
@@ -20,6 +109,7 @@ def main_menu_keyboard(is_admin: bool) -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(keyboard=buttons, resize_keyboard=True, one_time_keyboard=False)
 
 
+@_memoized(maxsize=None)
 def admin_main_keyboard() -> ReplyKeyboardMarkup:
     buttons = [
         [KeyboardButton(text="📂 Категории"), KeyboardButton(text="📋 Позиции")],
@@ -33,94 +123,93 @@ def admin_main_keyboard() -> ReplyKeyboardMarkup:
 # ─────────────────────── User: category / item lists ────────────────────────
 
 def categories_keyboard(
-    categories: list[tuple[int, str]],
+    categories: Iterable[tuple[int, str]],
 ) -> InlineKeyboardMarkup:
-    rows: list[list[InlineKeyboardButton]] = []
-    for cid, name in categories:
-        rows.append([InlineKeyboardButton(text=f"📂 {name}", callback_data=f"cat:{cid}")])
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+    rows = [
+        [InlineKeyboardButton(text=f"📂 {name}", callback_data=f"{_CATEGORY_DATA}{cid}")]
+        for cid, name in categories
+    ]
+    return _list_markup(rows)
 
 
 def items_keyboard(
-    items: list[tuple[int, str, str]],
+    items: Iterable[tuple[int, str, str]],
     show_back: bool = True,
 ) -> InlineKeyboardMarkup:
-    """items: list of (item_id, name, status_label)"""
-    STATUS_EMOJI = {
-        "available": "✅",
-        "taken": "🔴",
-        "lost": "❓",
-        "maintenance": "🔧",
-    }
-    rows: list[list[InlineKeyboardButton]] = []
-    for item_id, name, status_label in items:
-        emoji = STATUS_EMOJI.get(status_label, "•")
-        rows.append(
-            [
-                InlineKeyboardButton(
-                    text=f"{emoji} {name}",
-                    callback_data=f"item:{item_id}",
-                )
-            ]
-        )
+    """items: iterable of (item_id, name, status_label)"""
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=f"{_STATUS_EMOJI.get(status_label, '•')} {name}",
+                callback_data=f"{_ITEM_DATA}{item_id}",
+            )
+        ]
+        for item_id, name, status_label in items
+    ]
     if show_back:
-        rows.append(
-            [InlineKeyboardButton(text="← Назад к категориям", callback_data="back:categories")]
-        )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+        rows.append(_BACK_TO_CATEGORIES_ROW)
+    return _list_markup(rows)
 
 
+# (can_take, can_return) -> leading (text, callback factory) rows of the item card
+_ITEM_ACTION_ROWS: Final = {
+    (False, False): (),
+    (True, False): (("✋ Взять позицию", TakeCB),),
+    (False, True): (("↩️ Вернуть позицию", ReturnCB),),
+    (True, True): (("✋ Взять позицию", TakeCB), ("↩️ Вернуть позицию", ReturnCB)),
+}
+
+
+@_memoized(maxsize=4096)
 def item_actions_keyboard(
     item_id: int,
     can_take: bool,
     can_return: bool,
     category_id: int | None = None,
 ) -> InlineKeyboardMarkup:
-    buttons: list[list[InlineKeyboardButton]] = []
-    if can_take:
-        buttons.append(
-            [InlineKeyboardButton(text="✋ Взять позицию", callback_data=f"take:{item_id}")]
-        )
-    if can_return:
-        buttons.append(
-            [InlineKeyboardButton(text="↩️ Вернуть позицию", callback_data=f"return:{item_id}")]
-        )
+    buttons = [
+        [InlineKeyboardButton(text=text, callback_data=factory(item_id=item_id).pack())]
+        for text, factory in _ITEM_ACTION_ROWS[bool(can_take), bool(can_return)]
+    ]
     buttons.append(
         [InlineKeyboardButton(text="⚠️ Сообщить о проблеме", callback_data=f"report_prob:{item_id}")]
     )
-    back_data = f"back:items:{item_id}"
+    back_data = BackToItemsCB(item_id=item_id).pack()
     buttons.append(
         [InlineKeyboardButton(text="← Назад к списку", callback_data=back_data)]
     )
-    buttons.append(
-        [InlineKeyboardButton(text="← К категориям", callback_data="back:categories")]
-    )
+    buttons.append(_TO_CATEGORIES_ROW)
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
 # ───────────────────── Admin: category management ───────────────────────────
 
 def admin_categories_keyboard(
-    categories: list[tuple[int, str, bool]],
+    categories: Iterable[tuple[int, str, bool]],
 ) -> InlineKeyboardMarkup:
-    """categories: list of (id, name, is_active)"""
-    rows: list[list[InlineKeyboardButton]] = []
-    for cid, name, is_active in categories:
-        icon = "📂" if is_active else "🗂"
-        rows.append(
-            [
-                InlineKeyboardButton(
-                    text=f"{icon} {name}",
-                    callback_data=f"adm_cat:{cid}",
-                )
-            ]
-        )
-    rows.append(
-        [InlineKeyboardButton(text="➕ Создать категорию", callback_data="adm_cat:create")]
-    )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+    """categories: iterable of (id, name, is_active)"""
+    # the category list changes rarely, so identical lists share one markup
+    return _admin_categories_keyboard(tuple(categories))
+
+
+@_memoized(maxsize=128)
+def _admin_categories_keyboard(
+    categories: tuple[tuple[int, str, bool], ...],
+) -> InlineKeyboardMarkup:
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=f"{'📂' if is_active else '🗂'} {name}",
+                callback_data=f"adm_cat:{cid}",
+            )
+        ]
+        for cid, name, is_active in categories
+    ]
+    rows.append(_CREATE_CATEGORY_ROW)
+    return _list_markup(rows)
 
 
+@_memoized(maxsize=2048)
 def admin_category_actions_keyboard(category_id: int, is_active: bool) -> InlineKeyboardMarkup:
     toggle_text = "🔴 Деактивировать" if is_active else "🟢 Активировать"
     toggle_data = f"adm_cat_deact:{category_id}" if is_active else f"adm_cat_act:{category_id}"
@@ -134,6 +223,7 @@ def admin_category_actions_keyboard(category_id: int, is_active: bool) -> Inline
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@_memoized(maxsize=2048)
 def admin_confirm_delete_category_keyboard(category_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -152,62 +242,61 @@ def admin_confirm_delete_category_keyboard(category_id: int) -> InlineKeyboardMa
 # ───────────────────── Admin: item management ────────────────────────────────
 
 def admin_items_keyboard(
-    items: list[tuple[int, str, str]],
+    items: Iterable[tuple[int, str, str]],
     category_id: int,
 ) -> InlineKeyboardMarkup:
-    """items: list of (item_id, name, status)"""
-    STATUS_EMOJI = {
-        "available": "✅",
-        "taken": "🔴",
-        "lost": "❓",
-        "maintenance": "🔧",
-    }
-    rows: list[list[InlineKeyboardButton]] = []
-    for item_id, name, status in items:
-        emoji = STATUS_EMOJI.get(status, "•")
-        rows.append(
-            [
-                InlineKeyboardButton(
-                    text=f"{emoji} {name}",
-                    callback_data=f"adm_item:{item_id}",
-                )
-            ]
-        )
+    """items: iterable of (item_id, name, status)"""
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=f"{_STATUS_EMOJI.get(status, '•')} {name}",
+                callback_data=f"adm_item:{item_id}",
+            )
+        ]
+        for item_id, name, status in items
+    ]
     rows.append(
         [
             InlineKeyboardButton(
                 text="➕ Добавить позицию",
-                callback_data=f"adm_item_create:{category_id}",
+                callback_data=AdminItemCreateCB(category_id=category_id).pack(),
             )
         ]
     )
     rows.append(
         [InlineKeyboardButton(text="← Назад к категории", callback_data=f"adm_cat:{category_id}")]
     )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+    return _list_markup(rows)
 
 
+@_memoized(maxsize=1024)
 def admin_item_actions_keyboard(item_id: int, category_id: int, status: str) -> InlineKeyboardMarkup:
-    STATUS_LIST = [
-        ("available", "✅ Доступно"),
-        ("taken", "🔴 Выдано"),
-        ("maintenance", "🔧 На обслуживании"),
-        ("lost", "❓ Утеряно"),
-    ]
     status_buttons = []
-    for st_key, st_label in STATUS_LIST:
+    for st_key, st_label in _STATUS_CHOICES:
         if st_key != status:
             status_buttons.append(
                 InlineKeyboardButton(
-                    text=f"→ {st_label}",
-                    callback_data=f"adm_item_status:{item_id}:{st_key}",
+                    text=st_label,
+                    callback_data=AdminItemStatusCB(item_id=item_id, status=st_key).pack(),
                 )
             )
     buttons: list[list[InlineKeyboardButton]] = [
-        [InlineKeyboardButton(text="✏️ Переименовать", callback_data=f"adm_item_rename:{item_id}")],
-        [InlineKeyboardButton(text="🏷 Изменить инв. код", callback_data=f"adm_item_code:{item_id}")],
+        [
+            InlineKeyboardButton(
+                text="✏️ Переименовать", callback_data=AdminItemRenameCB(item_id=item_id).pack()
+            )
+        ],
+        [
+            InlineKeyboardButton(
+                text="🏷 Изменить инв. код", callback_data=AdminItemCodeCB(item_id=item_id).pack()
+            )
+        ],
         status_buttons,
-        [InlineKeyboardButton(text="🗑 Удалить позицию", callback_data=f"adm_item_del:{item_id}")],
+        [
+            InlineKeyboardButton(
+                text="🗑 Удалить позицию", callback_data=AdminItemDeleteCB(item_id=item_id).pack()
+            )
+        ],
         [InlineKeyboardButton(text="← Назад к списку", callback_data=f"adm_items:{category_id}")],
     ]
     # remove empty rows
@@ -215,12 +304,16 @@ def admin_item_actions_keyboard(item_id: int, category_id: int, status: str) ->
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+@_memoized(maxsize=2048)
 def admin_confirm_delete_item_keyboard(item_id: int, category_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [
                 InlineKeyboardButton(
-                    text="✅ Да, удалить", callback_data=f"adm_item_del_yes:{item_id}:{category_id}"
+                    text="✅ Да, удалить",
+                    callback_data=AdminItemDeleteConfirmCB(
+                        item_id=item_id, category_id=category_id
+                    ).pack(),
                 ),
                 InlineKeyboardButton(
                     text="❌ Отмена", callback_data=f"adm_item:{item_id}"
@@ -233,30 +326,29 @@ def admin_confirm_delete_item_keyboard(item_id: int, category_id: int) -> Inline
 # ─────────────────────── Admin: user management ─────────────────────────────
 
 def admin_users_keyboard(
-    users: list[tuple[int, str, bool]],
+    users: Iterable[tuple[int, str, bool]],
 ) -> InlineKeyboardMarkup:
-    """users: list of (user_id, display_name, is_admin)"""
-    rows: list[list[InlineKeyboardButton]] = []
-    for uid, name, is_admin in users:
-        icon = "👑" if is_admin else "👤"
-        rows.append(
-            [
-                InlineKeyboardButton(
-                    text=f"{icon} {name}",
-                    callback_data=f"adm_user:{uid}",
-                )
-            ]
-        )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+    """users: iterable of (user_id, display_name, is_admin)"""
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=f"{'👑' if is_admin else '👤'} {name}",
+                callback_data=f"{_ADMIN_USER_DATA}{uid}",
+            )
+        ]
+        for uid, name, is_admin in users
+    ]
+    return _list_markup(rows)
 
 
+@_memoized(maxsize=2048)
 def admin_user_actions_keyboard(user_id: int, is_admin: bool) -> InlineKeyboardMarkup:
     toggle_text = "⬇️ Снять права админа" if is_admin else "⬆️ Назначить админом"
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [
                 InlineKeyboardButton(
-                    text=toggle_text, callback_data=f"adm_user_toggle:{user_id}"
+                    text=toggle_text, callback_data=AdminUserToggleCB(user_id=user_id).pack()
                 )
             ],
             [
@@ -271,6 +363,7 @@ def admin_user_actions_keyboard(user_id: int, is_admin: bool) -> InlineKeyboardM
 
 # ─────────────────────── Cancel keyboard ────────────────────────────────────
 
+@_memoized(maxsize=None)
 def cancel_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -282,70 +375,57 @@ def cancel_keyboard() -> InlineKeyboardMarkup:
 # ─────────────────────── Overview keyboards ──────────────────────────────────
 
 def overview_on_hands_keyboard(
-    items: list[tuple[int, str, str]],
+    items: Iterable[tuple[int, str, str]],
 ) -> InlineKeyboardMarkup:
     """
-    items: list of (item_id, item_name, holder_display)
+    items: iterable of (item_id, item_name, holder_display)
     """
-    rows: list[list[InlineKeyboardButton]] = []
-    for item_id, item_name, holder in items:
-        rows.append(
-            [
-                InlineKeyboardButton(
-                    text=f"🔴 {item_name} — {holder}",
-                    callback_data=f"ovr_item:{item_id}",
-                )
-            ]
-        )
-    rows.append(
-        [InlineKeyboardButton(text="✅ Доступные позиции", callback_data="ovr_available")]
-    )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=f"🔴 {item_name} — {holder}",
+                callback_data=f"ovr_item:{item_id}",
+            )
+        ]
+        for item_id, item_name, holder in items
+    ]
+    rows.append(_OVERVIEW_AVAILABLE_ROW)
+    return _list_markup(rows)
 
 
 def overview_available_keyboard(
-    items: list[tuple[int, str]],
+    items: Iterable[tuple[int, str]],
 ) -> InlineKeyboardMarkup:
-    """items: list of (item_id, name)"""
-    rows: list[list[InlineKeyboardButton]] = []
-    for item_id, name in items:
-        rows.append(
-            [
-                InlineKeyboardButton(
-                    text=f"✅ {name}",
-                    callback_data=f"ovr_item:{item_id}",
-                )
-            ]
-        )
-    rows.append(
-        [InlineKeyboardButton(text="← Назад к обзору", callback_data="ovr_back")]
-    )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+    """items: iterable of (item_id, name)"""
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=f"✅ {name}",
+                callback_data=f"ovr_item:{item_id}",
+            )
+        ]
+        for item_id, name in items
+    ]
+    rows.append(_BACK_TO_OVERVIEW_ROW)
+    return _list_markup(rows)
 
 
 def item_history_keyboard(
-    transactions: list[tuple[int, str, str, str]],
+    transactions: Iterable[tuple[int, str]],
     item_id: int,
 ) -> InlineKeyboardMarkup:
     """
-    transactions: list of (tx_id, action_label, user_name, date_str)
+    transactions: iterable of (tx_id, label)
     """
-    rows: list[list[InlineKeyboardButton]] = []
-    for tx_id, action_label, user_name, date_str in transactions:
-        rows.append(
-            [
-                InlineKeyboardButton(
-                    text=f"{action_label} {user_name} · {date_str}",
-                    callback_data=f"ovr_tx:{tx_id}",
-                )
-            ]
-        )
-    rows.append(
-        [InlineKeyboardButton(text="← Назад к обзору", callback_data="ovr_back")]
-    )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
+    rows = [
+        [InlineKeyboardButton(text=label, callback_data=f"ovr_tx:{tx_id}")]
+        for tx_id, label in transactions
+    ]
+    rows.append(_BACK_TO_OVERVIEW_ROW)
+    return _list_markup(rows)
 
 
+@_memoized(maxsize=2048)
 def tx_photo_keyboard(tx_id: int, item_id: int) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -365,33 +445,48 @@ def tx_photo_keyboard(tx_id: int, item_id: int) -> InlineKeyboardMarkup:
     )
 
 
-def admin_search_results_keyboard(
-    items: list[tuple[int, str, str]],
-) -> InlineKeyboardMarkup:
-    """items: list of (item_id, name, status)"""
-    STATUS_EMOJI = {
-        "available": "✅",
-        "taken": "🔴",
-        "lost": "❓",
-        "maintenance": "🔧",
-    }
-    rows: list[list[InlineKeyboardButton]] = []
-    for item_id, name, status in items:
-        emoji = STATUS_EMOJI.get(status, "•")
-        rows.append(
+@_memoized(maxsize=2048)
+def tx_photo_back_keyboard(item_id: int) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
             [
                 InlineKeyboardButton(
-                    text=f"{emoji} {name}",
+                    text="← Назад к истории",
                     callback_data=f"ovr_item:{item_id}",
                 )
-            ]
-        )
-    rows.append(
-        [InlineKeyboardButton(text="← Назад", callback_data="adm_cancel")]
+            ],
+        ]
     )
-    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
+@_memoized(maxsize=None)
+def overview_back_keyboard() -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(inline_keyboard=[_BACK_TO_OVERVIEW_ROW])
+
+
+@_memoized(maxsize=None)
+def back_to_categories_keyboard() -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(inline_keyboard=[_TO_CATEGORIES_ROW])
+
+
+def admin_search_results_keyboard(
+    items: Iterable[tuple[int, str, str]],
+) -> InlineKeyboardMarkup:
+    """items: iterable of (item_id, name, status)"""
+    rows = [
+        [
+            InlineKeyboardButton(
+                text=f"{_STATUS_EMOJI.get(status, '•')} {name}",
+                callback_data=f"ovr_item:{item_id}",
+            )
+        ]
+        for item_id, name, status in items
+    ]
+    rows.append(_SEARCH_BACK_ROW)
+    return _list_markup(rows)
+
+
+@_memoized(maxsize=None)
 def admin_message_reply_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -419,3 +514,4 @@ def admin_problem_report_keyboard(report_id: int) -> InlineKeyboardMarkup:
             ],
         ]
     )
+
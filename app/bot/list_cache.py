@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories import CategoryRepository, ItemRepository, UserRepository
+from app.db.session import get_session
+
+
+def async_cached(ttl: float):
+    """
+    Cache the result of a zero-argument coroutine function for `ttl` seconds.
+    The wrapper gets an `invalidate()` method for writers to call.
+    """
+    def decorator(fn):
+        value = None
+        expires_at = 0.0
+        generation = 0
+        lock = asyncio.Lock()
+
+        @functools.wraps(fn)
+        async def wrapper():
+            nonlocal value, expires_at
+            if expires_at > time.monotonic():
+                return value
+            async with lock:
+                if expires_at > time.monotonic():
+                    return value
+                started = generation
+                result = await fn()
+                # an invalidate() during the query means the result may be stale
+                if started == generation:
+                    value, expires_at = result, time.monotonic() + ttl
+                return result
+
+        def invalidate() -> None:
+            nonlocal value, expires_at, generation
+            value, expires_at = None, 0.0
+            generation += 1
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
+
+
+@async_cached(ttl=60)
+async def active_categories() -> tuple[tuple[int, str], ...]:
+    """(id, name) of active categories, as shown in the user menu."""
+    async with get_session() as session:
+        return tuple(await CategoryRepository(session).list_active_rows())
+
+
+@async_cached(ttl=60)
+async def admin_chat_ids() -> tuple[int, ...]:
+    """Telegram ids of all admins, notified on every take/return."""
+    async with get_session() as session:
+        return tuple(await UserRepository(session).list_admin_chat_ids())
+
+
+_CATEGORY_ITEMS_TTL = 60.0
+_CATEGORY_ITEMS_MAXSIZE = 512
+
+# category_id -> ([(item_id, name, status)] ordered by name, expires_at), least
+# recently used first. Writers patch these rows after commit instead of re-reading
+# the category; the TTL bounds staleness from writes that bypass the helpers.
+_category_items: OrderedDict[int, tuple[list[tuple[int, str, str]], float]] = OrderedDict()
+# bumped by every writer, so a load that raced a write is not stored
+_category_items_generation = 0
+
+
+def _cached_rows(category_id: int) -> list[tuple[int, str, str]] | None:
+    entry = _category_items.get(category_id)
+    if entry is None:
+        return None
+    if entry[1] <= time.monotonic():
+        del _category_items[category_id]
+        return None
+    _category_items.move_to_end(category_id)
+    return entry[0]
+
+
+def _touch_category_items() -> None:
+    global _category_items_generation
+    _category_items_generation += 1
+
+
+async def category_items(session: AsyncSession, category_id: int) -> list[tuple[int, str, str]]:
+    rows = _cached_rows(category_id)
+    if rows is None:
+        started = _category_items_generation
+        items = await ItemRepository(session).list_rows_by_category(category_id)
+        rows = [(item_id, name, status.value) for item_id, name, status in items]
+        # a write during the query means these rows may already be stale
+        if started == _category_items_generation:
+            _category_items[category_id] = (rows, time.monotonic() + _CATEGORY_ITEMS_TTL)
+            if len(_category_items) > _CATEGORY_ITEMS_MAXSIZE:
+                _category_items.popitem(last=False)
+    return rows
+
+
+def add_category_item(category_id: int, item_id: int, name: str, status: str) -> None:
+    _touch_category_items()
+    rows = _cached_rows(category_id)
+    if rows is not None:
+        rows.append((item_id, name, status))
+        rows.sort(key=lambda row: row[1])
+
+
+def remove_category_item(category_id: int, item_id: int) -> None:
+    _touch_category_items()
+    rows = _cached_rows(category_id)
+    if rows is not None:
+        rows[:] = [row for row in rows if row[0] != item_id]
+
+
+def update_category_item(item_id: int, *, name: str | None = None, status: str | None = None) -> None:
+    _touch_category_items()
+    for rows, _ in _category_items.values():
+        for i, (row_id, row_name, row_status) in enumerate(rows):
+            if row_id == item_id:
+                rows[i] = (row_id, name or row_name, status or row_status)
+                if name:
+                    rows.sort(key=lambda row: row[1])
+                return
+
+
+def drop_category_items(category_id: int) -> None:
+    _touch_category_items()
+    _category_items.pop(category_id, None)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods import TelegramMethod
+from aiogram.types import InputFile
+from aiohttp import FormData
+
+
+# id(markup) -> weakref for markups that keyboards.py hands out repeatedly
+_reusable: dict[int, weakref.ref] = {}
+
+
+def mark_reusable(markup: Any) -> Any:
+    """Register a memoized markup whose JSON MarkupCachingSession may keep."""
+    key = id(markup)
+
+    def _forget(ref: weakref.ref, key: int = key) -> None:
+        if _reusable.get(key) is ref:
+            del _reusable[key]
+
+    _reusable[key] = weakref.ref(markup, _forget)
+    return markup
+
+
+def _is_reusable(markup: Any) -> bool:
+    ref = _reusable.get(id(markup))
+    return ref is not None and ref() is markup
+
+
+class MarkupCachingSession(AiohttpSession):
+    """
+    AiohttpSession that serializes each reply_markup object once.
+    keyboards.py hands out the same memoized markup objects over and over
+    (menus, cancel, item cards), so their JSON is kept per object.
+    Only markups registered via mark_reusable are cached; per-render list
+    keyboards go through the normal serialization.
+    """
+
+    def __init__(self, *args: Any, markup_cache_size: int = 512, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._markup_cache_size = markup_cache_size
+        # id(markup) -> (markup, json); holding the markup keeps its id from being reused
+        self._markup_json: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+
+    def _markup_to_json(self, markup: Any, bot: Bot) -> str:
+        key = id(markup)
+        entry = self._markup_json.get(key)
+        if entry is not None and entry[0] is markup:
+            self._markup_json.move_to_end(key)
+            return entry[1]
+        raw = self.prepare_value(markup, bot=bot, files={})
+        self._markup_json[key] = (markup, raw)
+        if len(self._markup_json) > self._markup_cache_size:
+            self._markup_json.popitem(last=False)
+        return raw
+
+    def build_form_data(self, bot: Bot, method: TelegramMethod[Any]) -> FormData:
+        markup = getattr(method, "reply_markup", None)
+        # per-render list keyboards are never sent twice, so they skip the cache
+        if markup is None or not _is_reusable(markup):
+            return super().build_form_data(bot, method)
+
+        # same as AiohttpSession.build_form_data, with reply_markup taken from the cache
+        form = FormData(quote_fields=False)
+        files: dict[str, InputFile] = {}
+        for key, value in method.model_dump(warnings=False, exclude={"reply_markup"}).items():
+            value = self.prepare_value(value, bot=bot, files=files)
+            if not value:
+                continue
+            form.add_field(key, value)
+        form.add_field("reply_markup", self._markup_to_json(markup, bot))
+        for key, value in files.items():
+            form.add_field(
+                key,
+                value.read(bot),
+                filename=value.filename or key,
+            )
+        return form
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+
+from aiogram import Bot
+
+from app.core.admin_service import AdminService
+
+
+@dataclass(frozen=True, slots=True)
+class NotifyJob:
+    chat_ids: tuple[int, ...]
+    text: str
+    photo: str | None = None
+
+
+class NotifyQueue:
+    """
+    Background delivery of admin notifications, so handlers can reply to
+    the user without waiting on Telegram calls to every admin.
+    Shared with handlers through Dispatcher workflow data as `notify_queue`.
+    """
+
+    def __init__(self, bot: Bot, maxsize: int = 1000, drain_timeout: float = 10.0) -> None:
+        self._bot = bot
+        self._queue: asyncio.Queue[NotifyJob] = asyncio.Queue(maxsize=maxsize)
+        self._drain_timeout = drain_timeout
+        self._worker: asyncio.Task | None = None
+
+    def put_nowait(self, job: NotifyJob) -> None:
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logging.error("Notification queue is full, dropping: %s...", job.text[:50])
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await AdminService.send_to_chats(self._bot, job.chat_ids, job.text, job.photo)
+            except Exception as e:
+                logging.error("Notification job failed: %s", e)
+            finally:
+                self._queue.task_done()
+
+    async def start(self) -> None:
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Deliver what is already queued (bounded by drain_timeout), then stop."""
+        if self._worker is None:
+            return
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._queue.join(), timeout=self._drain_timeout)
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
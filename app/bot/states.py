@@ -1,6 +1,18 @@
+from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 
 
+async def enter_state(state: FSMContext, new_state: State, **data) -> None:
+    """
+    Move to `new_state` and merge `data` into the FSM data.
+    Every "remember X, then wait for input" step goes through here, so a
+    storage that can write state and data together only needs changing once.
+    """
+    await state.set_state(new_state)
+    if data:
+        await state.update_data(data)
+
+
 # ── User flows ──────────────────────────────────────────────────────────────
 
 class TakeItemStates(StatesGroup):
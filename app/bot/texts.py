@@ -0,0 +1,21 @@
+from typing import Final
+
+
+STATUS_LABELS: Final = {
+    "available": "✅ Доступно",
+    "taken": "🔴 Выдано",
+    "lost": "❓ Утеряно",
+    "maintenance": "🔧 На обслуживании",
+}
+
+ITEM_DETAIL_TMPL: Final = "<b>📦 {name}</b>\nСтатус: {status}{code}{holder}"
+
+
+def format_item_detail(name: str, status: str, code: str = "", holder: str = "") -> str:
+    """
+    Item card header shared by the user and admin screens.
+    `status` is the raw value; `code` and `holder` are ready-made lines ("" to omit).
+    """
+    return ITEM_DETAIL_TMPL.format_map(
+        {"name": name, "status": STATUS_LABELS.get(status, status), "code": code, "holder": holder}
+    )
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from app.bot import list_cache
+from app.config import get_settings
+from app.core.inventory_service import InventoryService
+from app.db.session import get_session
+
+
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    """Detached snapshot of the fields handlers and services read from a User."""
+
+    id: int
+    telegram_id: int
+    username: str | None
+    first_name: str | None
+    last_name: str | None
+    is_admin: bool
+
+
+_CACHE_TTL = 300.0
+_CACHE_MAXSIZE = 10_000
+
+# telegram_id -> (user, expires_at)
+_cache: dict[int, tuple[CachedUser, float]] = {}
+# telegram_id -> in-flight ensure_user; duplicate misses for one account share it,
+# misses for different accounts run concurrently
+_pending: dict[int, asyncio.Task[CachedUser]] = {}
+
+
+def _lookup(from_user) -> CachedUser | None:
+    entry = _cache.get(from_user.id)
+    if entry is None or entry[1] <= time.monotonic():
+        return None
+    user = entry[0]
+    # a changed Telegram profile is a miss, so ensure_user stores the new fields
+    if (user.username, user.first_name, user.last_name) != (
+        from_user.username,
+        from_user.first_name,
+        from_user.last_name,
+    ):
+        return None
+    return user
+
+
+def _store(user: CachedUser) -> None:
+    now = time.monotonic()
+    if len(_cache) >= _CACHE_MAXSIZE:
+        for key in [k for k, (_, exp) in _cache.items() if exp <= now]:
+            del _cache[key]
+        if len(_cache) >= _CACHE_MAXSIZE:
+            # dicts keep insertion order, so this drops the oldest entry
+            del _cache[next(iter(_cache))]
+    _cache[user.telegram_id] = (user, now + _CACHE_TTL)
+
+
+def invalidate(telegram_id: int) -> None:
+    _cache.pop(telegram_id, None)
+
+
+async def _load(from_user) -> CachedUser:
+    settings = get_settings()
+    async with get_session() as session:
+        service = InventoryService(session)
+        db_user = await service.ensure_user(
+            telegram_id=from_user.id,
+            username=from_user.username,
+            first_name=from_user.first_name,
+            last_name=from_user.last_name,
+            initial_admin_ids=settings.initial_admin_ids,
+            initial_admin_usernames=settings.initial_admin_usernames,
+        )
+        await session.commit()
+    user = CachedUser(
+        id=db_user.id,
+        telegram_id=db_user.telegram_id,
+        username=db_user.username,
+        first_name=db_user.first_name,
+        last_name=db_user.last_name,
+        is_admin=db_user.is_admin,
+    )
+    _store(user)
+    if user.is_admin:
+        # ensure_user may have just promoted an INITIAL_ADMIN_* account
+        list_cache.admin_chat_ids.invalidate()
+    return user
+
+
+def _forget(telegram_id: int, task: asyncio.Task[CachedUser]) -> None:
+    if _pending.get(telegram_id) is task:
+        del _pending[telegram_id]
+
+
+async def get_user(from_user) -> CachedUser:
+    """
+    Return the stored user for a Telegram account.
+    On a miss (or after TTL / profile change) runs ensure_user and commits.
+    """
+    user = _lookup(from_user)
+    if user is not None:
+        return user
+
+    task = _pending.get(from_user.id)
+    if task is None:
+        task = asyncio.ensure_future(_load(from_user))
+        _pending[from_user.id] = task
+        task.add_done_callback(lambda done, tid=from_user.id: _forget(tid, done))
+    # shielded, so a cancelled handler doesn't cancel the load other waiters share
+    return await asyncio.shield(task)
@@ -1,6 +1,7 @@
 import os
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import FrozenSet
 
 from dotenv import load_dotenv
 
@@ -8,45 +9,60 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     bot_token: str
     db_url: str
-    initial_admin_ids: List[int]
-    initial_admin_usernames: List[str]
+    initial_admin_ids: FrozenSet[int]
+    initial_admin_usernames: FrozenSet[str]
+    debug: bool = False
+    db_pool_size: int = 50
+    db_max_overflow: int = 25
+    db_query_cache_size: int = 1200
+    db_pool_warm: int = 5
 
 
-def _parse_admin_ids(raw: str | None) -> List[int]:
+def _parse_admin_ids(raw: str | None) -> FrozenSet[int]:
+    # a set, since ensure_user checks membership on every new/changed user
     if not raw:
-        return []
-    ids: List[int] = []
+        return frozenset()
+    ids: set[int] = set()
     for part in raw.split(","):
         part = part.strip()
         if not part:
             continue
         try:
-            ids.append(int(part))
+            ids.add(int(part))
         except ValueError:
             continue
-    return ids
+    return frozenset(ids)
 
 
-def _parse_admin_usernames(raw: str | None) -> List[str]:
+@lru_cache(maxsize=8192)
+def normalize_username(username: str | None) -> str:
+    """Telegram username as compared against INITIAL_ADMIN_USERNAMES: no '@', lowercase."""
+    return (username or "").strip().lstrip("@").lower()
+
+
+def _parse_admin_usernames(raw: str | None) -> FrozenSet[str]:
     if not raw:
-        return []
-    names: List[str] = []
-    for part in raw.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        # normalize: remove leading '@', make lowercase
-        normalized = part.lstrip("@").lower()
-        if normalized:
-            names.append(normalized)
-    return names
+        return frozenset()
+    names = (normalize_username(part) for part in raw.split(","))
+    return frozenset(name for name in names if name)
+
+
+def _parse_int(raw: str | None, default: int) -> int:
+    if not raw:
+        return default
+    try:
+        return int(raw.strip())
+    except ValueError:
+        return default
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Parse settings from the environment once per process."""
     bot_token = os.getenv("BOT_TOKEN", "")
     if not bot_token:
         raise RuntimeError("BOT_TOKEN is not set in environment")
@@ -56,12 +72,22 @@ def get_settings() -> Settings:
     initial_admin_usernames = _parse_admin_usernames(
         os.getenv("INITIAL_ADMIN_USERNAMES")
     )
+    debug = os.getenv("DEBUG", "").strip().lower() in ("1", "true", "yes")
+    db_pool_size = _parse_int(os.getenv("DB_POOL_SIZE"), 50)
+    db_max_overflow = _parse_int(os.getenv("DB_MAX_OVERFLOW"), 25)
+    db_query_cache_size = _parse_int(os.getenv("DB_QUERY_CACHE_SIZE"), 1200)
+    db_pool_warm = _parse_int(os.getenv("DB_POOL_WARM"), 5)
 
     return Settings(
         bot_token=bot_token,
         db_url=db_url,
         initial_admin_ids=initial_admin_ids,
         initial_admin_usernames=initial_admin_usernames,
+        debug=debug,
+        db_pool_size=db_pool_size,
+        db_max_overflow=db_max_overflow,
+        db_query_cache_size=db_query_cache_size,
+        db_pool_warm=db_pool_warm,
     )
 
 
@@ -0,0 +1,24 @@
+from typing import Protocol
+
+
+class Actor(Protocol):
+    """
+    The acting Telegram user as services read it: either a models.User or the
+    detached user_cache.CachedUser handlers pass in. Only plain columns, so
+    service code can't reach for ORM relationships on it.
+    """
+
+    @property
+    def id(self) -> int: ...
+
+    @property
+    def telegram_id(self) -> int: ...
+
+    @property
+    def username(self) -> str | None: ...
+
+    @property
+    def first_name(self) -> str | None: ...
+
+    @property
+    def last_name(self) -> str | None: ...
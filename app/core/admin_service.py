@@ -1,6 +1,7 @@
 from __future__ import annotations
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Sequence
 
 from aiogram import Bot
@@ -9,6 +10,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.core.actor import Actor
 from app.db import models
 from app.db.models import ItemStatus, TransactionAction
 from app.db.repositories import (
@@ -20,40 +22,34 @@ from app.db.repositories import (
     UserRepository,
 )
 
+# caps parallel sends per broadcast below aiohttp's default connection limit
+_NOTIFY_SEM = asyncio.Semaphore(20)
 
-@dataclass
+
+@dataclass(slots=True)
 class AdminService:
     session: AsyncSession
-
-    @property
-    def users(self) -> UserRepository:
-        return UserRepository(self.session)
-
-    @property
-    def categories(self) -> CategoryRepository:
-        return CategoryRepository(self.session)
-
-    @property
-    def items(self) -> ItemRepository:
-        return ItemRepository(self.session)
-
-    @property
-    def transactions(self) -> TransactionRepository:
-        return TransactionRepository(self.session)
-
-    @property
-    def logs(self) -> AdminLogRepository:
-        return AdminLogRepository(self.session)
-
-    @property
-    def problem_reports(self) -> ProblemReportRepository:
-        return ProblemReportRepository(self.session)
+    users: UserRepository = field(init=False, repr=False)
+    categories: CategoryRepository = field(init=False, repr=False)
+    items: ItemRepository = field(init=False, repr=False)
+    transactions: TransactionRepository = field(init=False, repr=False)
+    logs: AdminLogRepository = field(init=False, repr=False)
+    problem_reports: ProblemReportRepository = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # one repository of each kind per service (i.e. per session)
+        self.users = UserRepository(self.session)
+        self.categories = CategoryRepository(self.session)
+        self.items = ItemRepository(self.session)
+        self.transactions = TransactionRepository(self.session)
+        self.logs = AdminLogRepository(self.session)
+        self.problem_reports = ProblemReportRepository(self.session)
 
     # ── Categories ──────────────────────────────────────────────────────────
 
     async def create_category(
         self,
-        admin: models.User,
+        admin: Actor,
         name: str,
         description: str | None = None,
     ) -> models.Category:
@@ -68,11 +64,11 @@ class AdminService:
 
     async def rename_category(
         self,
-        admin: models.User,
+        admin: Actor,
         category_id: int,
         new_name: str,
     ) -> bool:
-        ok = await self.categories.rename(category_id, new_name)
+        ok = await self.categories.rename(category_id, new_name) is not None
         if ok:
             await self.logs.log(
                 admin_id=admin.id,
@@ -81,27 +77,31 @@ class AdminService:
             )
         return ok
 
-    async def deactivate_category(self, admin: models.User, category_id: int) -> bool:
-        ok = await self.categories.soft_delete(category_id)
-        if ok:
+    async def deactivate_category(
+        self, admin: Actor, category_id: int
+    ) -> models.Category | None:
+        category = await self.categories.soft_delete(category_id)
+        if category is not None:
             await self.logs.log(
                 admin_id=admin.id,
                 action="deactivate_category",
                 details=f"id={category_id}",
             )
-        return ok
+        return category
 
-    async def activate_category(self, admin: models.User, category_id: int) -> bool:
-        ok = await self.categories.set_active(category_id, active=True)
-        if ok:
+    async def activate_category(
+        self, admin: Actor, category_id: int
+    ) -> models.Category | None:
+        category = await self.categories.set_active(category_id, active=True)
+        if category is not None:
             await self.logs.log(
                 admin_id=admin.id,
                 action="activate_category",
                 details=f"id={category_id}",
             )
-        return ok
+        return category
 
-    async def delete_category(self, admin: models.User, category_id: int) -> bool:
+    async def delete_category(self, admin: Actor, category_id: int) -> bool:
         ok = await self.categories.hard_delete(category_id)
         if ok:
             await self.logs.log(
@@ -115,7 +115,7 @@ class AdminService:
 
     async def create_item(
         self,
-        admin: models.User,
+        admin: Actor,
         category_id: int,
         name: str,
         inventory_code: str | None = None,
@@ -135,11 +135,11 @@ class AdminService:
 
     async def rename_item(
         self,
-        admin: models.User,
+        admin: Actor,
         item_id: int,
         new_name: str,
     ) -> bool:
-        ok = await self.items.update(item_id, name=new_name)
+        ok = await self.items.update(item_id, name=new_name) is not None
         if ok:
             await self.logs.log(
                 admin_id=admin.id,
@@ -150,11 +150,11 @@ class AdminService:
 
     async def update_item_code(
         self,
-        admin: models.User,
+        admin: Actor,
         item_id: int,
         new_code: str,
     ) -> bool:
-        ok = await self.items.update(item_id, inventory_code=new_code)
+        ok = await self.items.update(item_id, inventory_code=new_code) is not None
         if ok:
             await self.logs.log(
                 admin_id=admin.id,
@@ -163,7 +163,7 @@ class AdminService:
             )
         return ok
 
-    async def delete_item(self, admin: models.User, item_id: int) -> bool:
+    async def delete_item(self, admin: Actor, item_id: int) -> bool:
         ok = await self.items.delete(item_id)
         if ok:
             await self.logs.log(
@@ -175,27 +175,23 @@ class AdminService:
 
     async def set_item_status(
         self,
-        admin: models.User,
+        admin: Actor,
         item_id: int,
         status: ItemStatus,
-    ) -> bool:
-        item = await self.items.get_by_id(item_id)
+    ) -> models.Item | None:
+        item = await self.items.set_status(item_id, status)
         if item is None:
-            return False
-        item.status = status
-        if status != ItemStatus.TAKEN:
-            item.current_holder_id = None
+            return None
         await self.logs.log(
             admin_id=admin.id,
             action="set_item_status",
             details=f"item_id={item_id},status={status.value}",
         )
-        await self.session.flush()
-        return True
+        return item
 
     # ── Users ────────────────────────────────────────────────────────────────
 
-    async def toggle_admin(self, admin: models.User, target_user_id: int) -> bool | None:
+    async def toggle_admin(self, admin: Actor, target_user_id: int) -> bool | None:
         new_value = await self.users.toggle_admin(target_user_id)
         if new_value is not None:
             await self.logs.log(
@@ -203,30 +199,41 @@ class AdminService:
                 action="toggle_admin",
                 details=f"target_user_id={target_user_id},new_is_admin={new_value}",
             )
-            await self.session.flush()
         return new_value
 
+    async def admin_chat_ids(self) -> list[int]:
+        return await self.users.list_admin_chat_ids()
+
     async def notify_admins(self, bot: Bot, text: str, photo: str | None = None) -> None:
         """Send a message to all administrators."""
-        admins = await self.users.list_admins()
-        for admin in admins:
-            try:
-                if photo:
-                    await bot.send_photo(
-                        chat_id=admin.telegram_id,
-                        photo=photo,
-                        caption=text,
-                    )
-                else:
-                    await bot.send_message(
-                        chat_id=admin.telegram_id,
-                        text=text,
-                    )
-            except Exception as e:
-                logging.error(f"Failed to notify admin {admin.telegram_id}: {e}")
+        await self.send_to_chats(bot, await self.admin_chat_ids(), text, photo)
+
+    @staticmethod
+    async def send_to_chats(
+        bot: Bot, chat_ids: Sequence[int], text: str, photo: str | None = None
+    ) -> None:
+        """Send the same message to several chats concurrently; one failure doesn't stop the rest."""
+        async def _send(chat_id: int) -> None:
+            async with _NOTIFY_SEM:
+                try:
+                    if photo:
+                        await bot.send_photo(
+                            chat_id=chat_id,
+                            photo=photo,
+                            caption=text,
+                        )
+                    else:
+                        await bot.send_message(
+                            chat_id=chat_id,
+                            text=text,
+                        )
+                except Exception as e:
+                    logging.error("Failed to notify admin %s: %s", chat_id, e)
+
+        await asyncio.gather(*(_send(chat_id) for chat_id in chat_ids))
 
     async def send_user_message(
-        self, bot: Bot, admin: models.User, target_user: models.User, text: str, reply_markup=None
+        self, bot: Bot, admin: Actor, target_user: models.User, text: str, reply_markup=None
     ) -> bool:
         """Send a message from an admin to a specific user and log it."""
         try:
@@ -240,10 +247,9 @@ class AdminService:
                 action="send_user_msg",
                 details=f"target_user_id={target_user.id},text={text[:50]}...",
             )
-            await self.session.flush()
             return True
         except Exception as e:
-            logging.error(f"Failed to send message to user {target_user.telegram_id}: {e}")
+            logging.error("Failed to send message to user %s: %s", target_user.telegram_id, e)
             return False
 
     # ── Statistics & Problems ────────────────────────────────────────────────
@@ -251,7 +257,7 @@ class AdminService:
     async def list_unresolved_problems(self) -> Sequence[models.ProblemReport]:
         return await self.problem_reports.list_unresolved()
 
-    async def resolve_problem(self, admin: models.User, report_id: int) -> bool:
+    async def resolve_problem(self, admin: Actor, report_id: int) -> bool:
         ok = await self.problem_reports.resolve(report_id)
         if ok:
             await self.logs.log(
@@ -259,7 +265,6 @@ class AdminService:
                 action="resolve_problem",
                 details=f"report_id={report_id}",
             )
-            await self.session.flush()
         return ok
 
     async def get_statistics(self) -> dict:
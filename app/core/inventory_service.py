@@ -1,9 +1,12 @@
 import logging
 
-from dataclasses import dataclass
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import normalize_username
+from app.core.actor import Actor
 from app.db import models
 from app.db.models import ItemStatus, TransactionAction
 from app.db.repositories import (
@@ -15,29 +18,22 @@ from app.db.repositories import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryService:
     session: AsyncSession
-
-    @property
-    def users(self) -> UserRepository:
-        return UserRepository(self.session)
-
-    @property
-    def categories(self) -> CategoryRepository:
-        return CategoryRepository(self.session)
-
-    @property
-    def items(self) -> ItemRepository:
-        return ItemRepository(self.session)
-
-    @property
-    def transactions(self) -> TransactionRepository:
-        return TransactionRepository(self.session)
-
-    @property
-    def problem_reports(self) -> ProblemReportRepository:
-        return ProblemReportRepository(self.session)
+    users: UserRepository = field(init=False, repr=False)
+    categories: CategoryRepository = field(init=False, repr=False)
+    items: ItemRepository = field(init=False, repr=False)
+    transactions: TransactionRepository = field(init=False, repr=False)
+    problem_reports: ProblemReportRepository = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # one repository of each kind per service (i.e. per session)
+        self.users = UserRepository(self.session)
+        self.categories = CategoryRepository(self.session)
+        self.items = ItemRepository(self.session)
+        self.transactions = TransactionRepository(self.session)
+        self.problem_reports = ProblemReportRepository(self.session)
 
     async def ensure_user(
         self,
@@ -45,10 +41,10 @@ class InventoryService:
         username: str | None,
         first_name: str | None,
         last_name: str | None,
-        initial_admin_ids: list[int],
-        initial_admin_usernames: list[str],
+        initial_admin_ids: Collection[int],
+        initial_admin_usernames: Collection[str],
     ) -> models.User:
-        normalized_username = (username or "").lstrip("@").lower()
+        normalized_username = normalize_username(username)
         make_admin = telegram_id in initial_admin_ids or (
             normalized_username in initial_admin_usernames if normalized_username else False
         )
@@ -62,35 +58,30 @@ class InventoryService:
         await self.session.flush()
         return user
 
-    async def list_categories(self) -> list[models.Category]:
-        categories = await self.categories.list_active()
-        return list(categories)
+    async def list_categories(self) -> Sequence[models.Category]:
+        return await self.categories.list_active()
 
-    async def list_items_for_category(self, category_id: int) -> list[models.Item]:
-        items = await self.items.list_by_category(category_id)
-        return list(items)
+    async def list_items_for_category(self, category_id: int) -> Sequence[models.Item]:
+        return await self.items.list_by_category(category_id)
 
-    async def list_items_for_user(self, user_id: int) -> list[models.Item]:
-        items = await self.items.list_for_holder(user_id)
-        return list(items)
+    async def list_items_for_user(self, user_id: int) -> Sequence[models.Item]:
+        return await self.items.list_for_holder(user_id)
 
     async def take_item(
         self,
         item_id: int,
-        user: models.User,
+        user: Actor,
         photo_file_id: str,
         comment: str | None = None,
-    ) -> models.Transaction:
-        item = await self.items.get_by_id(item_id)
+    ) -> models.Item:
+        item = await self.items.take_atomic(item_id, user.id)
         if item is None:
-            raise ValueError("Item not found")
-        if item.status != ItemStatus.AVAILABLE:
+            # only the failure path pays for a second query, to pick the message
+            if await self.session.get(models.Item, item_id) is None:
+                raise ValueError("Item not found")
             raise ValueError("Item is not available")
 
-        item.status = ItemStatus.TAKEN
-        item.current_holder_id = user.id
-
-        tx = await self.transactions.add_transaction(
+        await self.transactions.add_transaction(
             item_id=item.id,
             user_id=user.id,
             action=TransactionAction.TAKE,
@@ -98,19 +89,19 @@ class InventoryService:
             comment=comment,
         )
         logging.info(
-            f"USER_TAKE: User {user.id} ({user.username or user.telegram_id}) "
-            f"took item {item.id} ('{item.name}')"
+            "USER_TAKE: User %s (%s) took item %s ('%s')",
+            user.id, user.username or user.telegram_id, item.id, item.name,
         )
         await self.session.flush()
-        return tx
+        return item
 
     async def return_item(
         self,
         item_id: int,
-        user: models.User,
+        user: Actor,
         photo_file_id: str,
         comment: str | None = None,
-    ) -> models.Transaction:
+    ) -> models.Item:
         item = await self.items.get_by_id(item_id)
         if item is None:
             raise ValueError("Item not found")
@@ -123,7 +114,7 @@ class InventoryService:
         item.status = ItemStatus.AVAILABLE
         item.current_holder_id = None
 
-        tx = await self.transactions.add_transaction(
+        await self.transactions.add_transaction(
             item_id=item.id,
             user_id=user.id,
             action=TransactionAction.RETURN,
@@ -131,16 +122,16 @@ class InventoryService:
             comment=comment,
         )
         logging.info(
-            f"USER_RETURN: User {user.id} ({user.username or user.telegram_id}) "
-            f"returned item {item.id} ('{item.name}')"
+            "USER_RETURN: User %s (%s) returned item %s ('%s')",
+            user.id, user.username or user.telegram_id, item.id, item.name,
         )
         await self.session.flush()
-        return tx
+        return item
 
     async def report_problem(
         self,
         item_id: int,
-        user: models.User,
+        user: Actor,
         description: str,
     ) -> models.ProblemReport:
         item = await self.items.get_by_id(item_id)
@@ -153,7 +144,8 @@ class InventoryService:
             description=description,
         )
         logging.info(
-            f"PROBLEM_REPORT: User {user.id} reported problem on item {item.id} ('{item.name}'): {description[:50]}..."
+            "PROBLEM_REPORT: User %s reported problem on item %s ('%s'): %s...",
+            user.id, item.id, item.name, description[:50],
         )
         await self.session.flush()
         return report
@@ -10,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -19,6 +20,8 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.session import Base
 
 
+# Stored as VARCHAR + CHECK rather than a PostgreSQL ENUM type; SQLAlchemy
+# still converts to and from these enums. Existing databases keep their type.
 class ItemStatus(str, enum.Enum):
     AVAILABLE = "available"
     TAKEN = "taken"
@@ -48,11 +51,13 @@ class User(Base):
 
     items: Mapped[list["Item"]] = relationship(
         back_populates="current_holder",
+        lazy="raise_on_sql",
         cascade="all",
         passive_deletes=True,
     )
     transactions: Mapped[list["Transaction"]] = relationship(
         back_populates="user",
+        lazy="raise_on_sql",
         cascade="all",
         passive_deletes=True,
     )
@@ -73,6 +78,7 @@ class Category(Base):
 
     items: Mapped[list["Item"]] = relationship(
         back_populates="category",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
 
@@ -88,7 +94,13 @@ class Item(Base):
     name: Mapped[str] = mapped_column(String(128), nullable=False)
     inventory_code: Mapped[str | None] = mapped_column(String(64), unique=True)
     status: Mapped[ItemStatus] = mapped_column(
-        Enum(ItemStatus, values_callable=lambda obj: [e.value for e in obj]),
+        Enum(
+            ItemStatus,
+            values_callable=lambda obj: [e.value for e in obj],
+            native_enum=False,
+            length=16,
+            create_constraint=True,
+        ),
         default=ItemStatus.AVAILABLE,
         nullable=False,
     )
@@ -102,14 +114,49 @@ class Item(Base):
         nullable=False,
     )
 
-    category: Mapped["Category"] = relationship(back_populates="items")
-    current_holder: Mapped["User | None"] = relationship(back_populates="items")
+    category: Mapped["Category"] = relationship(back_populates="items", lazy="raise_on_sql")
+    current_holder: Mapped["User | None"] = relationship(
+        back_populates="items", lazy="raise_on_sql"
+    )
     transactions: Mapped[list["Transaction"]] = relationship(
         back_populates="item",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
 
 
+# Category item lists (filter + ORDER BY name) are answered from the index alone
+Index("ix_items_category_name", Item.category_id, Item.name, Item.status)
+
+# Available / on-hands lists filter on status and sort by name (overview screens)
+Index("ix_items_status_name", Item.status, Item.name)
+
+# search() runs ILIKE '%q%' on name and code; trigram GIN indexes serve that
+# on PostgreSQL (pg_trgm is enabled in init_db). Other backends skip them.
+Index(
+    "ix_items_name_trgm",
+    Item.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_items_code_trgm",
+    Item.inventory_code,
+    postgresql_using="gin",
+    postgresql_ops={"inventory_code": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+# Only taken items have a holder, so "my items" scans just that slice
+_holder_taken = Item.status == ItemStatus.TAKEN
+Index(
+    "ix_items_holder_taken",
+    Item.current_holder_id,
+    Item.name,
+    sqlite_where=_holder_taken,
+    postgresql_where=_holder_taken,
+)
+
+
 class Transaction(Base):
     __tablename__ = "transactions"
 
@@ -123,7 +170,13 @@ class Transaction(Base):
         nullable=False,
     )
     action: Mapped[TransactionAction] = mapped_column(
-        Enum(TransactionAction, values_callable=lambda obj: [e.value for e in obj]),
+        Enum(
+            TransactionAction,
+            values_callable=lambda obj: [e.value for e in obj],
+            native_enum=False,
+            length=16,
+            create_constraint=True,
+        ),
         nullable=False,
     )
     photo_file_id: Mapped[str] = mapped_column(String(256), nullable=False)
@@ -135,8 +188,18 @@ class Transaction(Base):
         nullable=False,
     )
 
-    item: Mapped["Item"] = relationship(back_populates="transactions")
-    user: Mapped["User"] = relationship(back_populates="transactions")
+    item: Mapped["Item"] = relationship(back_populates="transactions", lazy="raise_on_sql")
+    user: Mapped["User"] = relationship(back_populates="transactions", lazy="raise_on_sql")
+
+
+# Latest TAKE per item (holder lookup, overview LATERAL / ROW_NUMBER)
+# becomes a single index probe, read in id order
+Index(
+    "ix_tx_item_action_id",
+    Transaction.item_id,
+    Transaction.action,
+    Transaction.id.desc(),
+)
 
 
 class AdminLog(Base):
@@ -176,6 +239,6 @@ class ProblemReport(Base):
         nullable=False,
     )
 
-    item: Mapped["Item"] = relationship()
-    user: Mapped["User"] = relationship()
+    item: Mapped["Item"] = relationship(lazy="raise_on_sql")
+    user: Mapped["User"] = relationship(lazy="raise_on_sql")
 
@@ -2,15 +2,42 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from sqlalchemy import Select, delete, or_, select, update
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import Select, delete, func, not_, or_, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import load_only, raiseload, selectinload, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.db import models
 from app.db.models import ItemStatus, TransactionAction
 
 
+def _load_opts(*loaders, strict: bool | None = None) -> list:
+    """
+    Loader options for a query. In debug mode any relationship that is not
+    explicitly eager-loaded raises on access instead of lazy-loading,
+    so new N+1 patterns fail loudly.
+    """
+    if strict is None:
+        strict = get_settings().debug
+    if strict:
+        return [*loaders, raiseload("*")]
+    return list(loaders)
+
+
+# dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (used with escape="\\")."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class UserRepository:
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
@@ -22,6 +49,31 @@ class UserRepository:
         last_name: str | None,
         make_admin: bool = False,
     ) -> models.User:
+        dialect_insert = _UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if dialect_insert is not None:
+            # one atomic statement instead of SELECT + INSERT, and no race on telegram_id
+            insert_stmt = dialect_insert(models.User).values(
+                telegram_id=telegram_id,
+                username=username,
+                first_name=first_name,
+                last_name=last_name,
+                is_admin=make_admin,
+            )
+            set_: dict = {
+                "username": insert_stmt.excluded.username,
+                "first_name": insert_stmt.excluded.first_name,
+                "last_name": insert_stmt.excluded.last_name,
+            }
+            if make_admin:
+                set_["is_admin"] = True
+            stmt = (
+                insert_stmt.on_conflict_do_update(index_elements=["telegram_id"], set_=set_)
+                .returning(models.User)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            return result.scalar_one()
+
         stmt: Select[tuple[models.User]] = select(models.User).where(
             models.User.telegram_id == telegram_id
         )
@@ -62,16 +114,28 @@ class UserRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def list_admin_chat_ids(self) -> list[int]:
+        """Telegram ids of all admins, without loading User entities."""
+        stmt = select(models.User.telegram_id).where(models.User.is_admin == True)
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
+
     async def toggle_admin(self, user_id: int) -> bool | None:
         """Returns new is_admin value, or None if user not found."""
-        user = await self.session.get(models.User, user_id)
-        if user is None:
-            return None
-        user.is_admin = not user.is_admin
-        return user.is_admin
+        stmt = (
+            update(models.User)
+            .where(models.User.id == user_id)
+            .values(is_admin=not_(models.User.is_admin))
+            .returning(models.User)
+        )
+        result = await self.session.execute(stmt)
+        user = result.scalar_one_or_none()
+        return None if user is None else user.is_admin
 
 
 class CategoryRepository:
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
@@ -89,6 +153,30 @@ class CategoryRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def list_active_rows(self) -> Sequence[tuple[int, str]]:
+        """(id, name) of active categories, without loading ORM entities."""
+        stmt = (
+            select(models.Category.id, models.Category.name)
+            .where(models.Category.is_active.is_(True))
+            .order_by(models.Category.name)
+        )
+        result = await self.session.execute(stmt)
+        return result.tuples().all()
+
+    async def list_all_rows(self) -> Sequence[tuple[int, str, bool]]:
+        """(id, name, is_active) of all categories, without loading ORM entities."""
+        stmt = select(
+            models.Category.id, models.Category.name, models.Category.is_active
+        ).order_by(models.Category.name)
+        result = await self.session.execute(stmt)
+        return result.tuples().all()
+
+    async def count_active(self) -> int:
+        stmt = select(func.count(models.Category.id)).where(
+            models.Category.is_active.is_(True)
+        )
+        return await self.session.scalar(stmt) or 0
+
     async def get_by_id(self, category_id: int) -> models.Category | None:
         return await self.session.get(models.Category, category_id)
 
@@ -102,56 +190,45 @@ class CategoryRepository:
         category_id: int,
         name: str | None = None,
         description: str | None = None,
-    ) -> bool:
+    ) -> models.Category | None:
         values: dict = {}
         if name is not None:
             values["name"] = name
         if description is not None:
             values["description"] = description
         if not values:
-            return False
-        stmt = (
-            update(models.Category)
-            .where(models.Category.id == category_id)
-            .values(**values)
-        )
-        result = await self.session.execute(stmt)
-        return result.rowcount > 0
+            return None
+        return await self._update_returning(category_id, values)
 
-    async def rename(self, category_id: int, new_name: str) -> bool:
-        stmt = (
-            update(models.Category)
-            .where(models.Category.id == category_id)
-            .values(name=new_name)
-        )
-        result = await self.session.execute(stmt)
-        return result.rowcount > 0
+    async def rename(self, category_id: int, new_name: str) -> models.Category | None:
+        return await self._update_returning(category_id, {"name": new_name})
 
-    async def soft_delete(self, category_id: int) -> bool:
-        stmt = (
-            update(models.Category)
-            .where(models.Category.id == category_id)
-            .values(is_active=False)
-        )
-        result = await self.session.execute(stmt)
-        return result.rowcount > 0
+    async def soft_delete(self, category_id: int) -> models.Category | None:
+        return await self._update_returning(category_id, {"is_active": False})
 
     async def hard_delete(self, category_id: int) -> bool:
         stmt = delete(models.Category).where(models.Category.id == category_id)
         result = await self.session.execute(stmt)
         return result.rowcount > 0
 
-    async def set_active(self, category_id: int, active: bool) -> bool:
+    async def set_active(self, category_id: int, active: bool) -> models.Category | None:
+        return await self._update_returning(category_id, {"is_active": active})
+
+    async def _update_returning(self, category_id: int, values: dict) -> models.Category | None:
+        """UPDATE ... RETURNING the category, so callers get the fresh row without a SELECT."""
         stmt = (
             update(models.Category)
             .where(models.Category.id == category_id)
-            .values(is_active=active)
+            .values(**values)
+            .returning(models.Category)
         )
         result = await self.session.execute(stmt)
-        return result.rowcount > 0
+        return result.scalar_one_or_none()
 
 
 class ItemRepository:
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
@@ -159,14 +236,27 @@ class ItemRepository:
         stmt: Select[tuple[models.Item]] = (
             select(models.Item)
             .where(models.Item.category_id == category_id)
+            .options(*_load_opts())
             .order_by(models.Item.name)
         )
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def list_rows_by_category(self, category_id: int) -> Sequence[tuple[int, str, ItemStatus]]:
+        """(id, name, status) of a category's items, without loading ORM entities."""
+        stmt = (
+            select(models.Item.id, models.Item.name, models.Item.status)
+            .where(models.Item.category_id == category_id)
+            .order_by(models.Item.name)
+        )
+        result = await self.session.execute(stmt)
+        return result.tuples().all()
+
     async def list_on_hands(self) -> Sequence[models.Item]:
-        stmt: Select[tuple[models.Item]] = select(models.Item).where(
-            models.Item.status == ItemStatus.TAKEN
+        stmt: Select[tuple[models.Item]] = (
+            select(models.Item)
+            .where(models.Item.status == ItemStatus.TAKEN)
+            .options(*_load_opts())
         )
         result = await self.session.execute(stmt)
         return result.scalars().all()
@@ -175,33 +265,64 @@ class ItemRepository:
         stmt: Select[tuple[models.Item]] = (
             select(models.Item)
             .where(models.Item.status == models.ItemStatus.AVAILABLE)
+            .options(*_load_opts())
             .order_by(models.Item.name)
         )
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def count_by_category(self, category_id: int) -> int:
+        stmt = select(func.count(models.Item.id)).where(models.Item.category_id == category_id)
+        return await self.session.scalar(stmt) or 0
+
+    async def count_by_status(self, status: ItemStatus) -> int:
+        stmt = select(func.count(models.Item.id)).where(models.Item.status == status)
+        return await self.session.scalar(stmt) or 0
+
     async def list_for_holder(self, user_id: int) -> Sequence[models.Item]:
         stmt: Select[tuple[models.Item]] = (
             select(models.Item)
-            .where(models.Item.current_holder_id == user_id)
+            .where(
+                models.Item.current_holder_id == user_id,
+                # matches the partial index; only taken items have a holder
+                models.Item.status == ItemStatus.TAKEN,
+            )
+            .options(*_load_opts())
             .order_by(models.Item.name)
         )
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def list_rows_for_holder(self, user_id: int) -> Sequence[tuple[int, str]]:
+        """(id, name) of items held by a user, without loading ORM entities."""
+        stmt = (
+            select(models.Item.id, models.Item.name)
+            .where(
+                models.Item.current_holder_id == user_id,
+                # matches the partial index; only taken items have a holder
+                models.Item.status == ItemStatus.TAKEN,
+            )
+            .order_by(models.Item.name)
+        )
+        result = await self.session.execute(stmt)
+        return result.tuples().all()
+
     async def search(self, query: str) -> Sequence[models.Item]:
         """Search items by name or inventory code."""
-        # Use simple substring search for name and code
-        pattern = f"%{query}%"
+        # Substring search for name and code; an exact code hit (unique
+        # index) always ranks first so it is never cut off by the limit
+        # ILIKE rather than icontains(): lower() LIKE would bypass the trigram indexes
+        pattern = f"%{_escape_like(query)}%"
         stmt = (
             select(models.Item)
             .where(
                 or_(
-                    models.Item.name.ilike(pattern),
-                    models.Item.inventory_code.ilike(pattern),
+                    models.Item.inventory_code == query,
+                    models.Item.name.ilike(pattern, escape="\\"),
+                    models.Item.inventory_code.ilike(pattern, escape="\\"),
                 )
             )
-            .order_by(models.Item.name)
+            .order_by((models.Item.inventory_code == query).desc(), models.Item.name)
             .limit(50)
         )
         result = await self.session.execute(stmt)
@@ -211,7 +332,7 @@ class ItemRepository:
         stmt = (
             select(models.Item)
             .where(models.Item.id == item_id)
-            .options(joinedload(models.Item.current_holder))
+            .options(*_load_opts(joinedload(models.Item.current_holder)))
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
@@ -235,21 +356,50 @@ class ItemRepository:
         item_id: int,
         name: str | None = None,
         inventory_code: str | None = None,
-    ) -> bool:
+    ) -> models.Item | None:
         values: dict = {}
         if name is not None:
             values["name"] = name
         if inventory_code is not None:
             values["inventory_code"] = inventory_code
         if not values:
-            return False
+            return None
         stmt = (
             update(models.Item)
             .where(models.Item.id == item_id)
             .values(**values)
+            .returning(models.Item)
         )
         result = await self.session.execute(stmt)
-        return result.rowcount > 0
+        return result.scalar_one_or_none()
+
+    async def set_status(self, item_id: int, status: ItemStatus) -> models.Item | None:
+        """Update status in one UPDATE ... RETURNING; clears the holder unless TAKEN."""
+        values: dict = {"status": status}
+        if status is not ItemStatus.TAKEN:
+            values["current_holder_id"] = None
+        stmt = (
+            update(models.Item)
+            .where(models.Item.id == item_id)
+            .values(**values)
+            .returning(models.Item)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def take_atomic(self, item_id: int, user_id: int) -> models.Item | None:
+        """
+        Mark an AVAILABLE item as TAKEN by user_id in one UPDATE ... RETURNING.
+        None if the item is missing or not available, so concurrent takes can't both win.
+        """
+        stmt = (
+            update(models.Item)
+            .where(models.Item.id == item_id, models.Item.status == ItemStatus.AVAILABLE)
+            .values(status=ItemStatus.TAKEN, current_holder_id=user_id)
+            .returning(models.Item)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def delete(self, item_id: int) -> bool:
         stmt = delete(models.Item).where(models.Item.id == item_id)
@@ -257,7 +407,20 @@ class ItemRepository:
         return result.rowcount > 0
 
 
+# What the history / holder screens show; photo_url and comment (TEXT) stay
+# unloaded and raise if touched. Detail views load the full row by id.
+_TX_SUMMARY = load_only(
+    models.Transaction.item_id,
+    models.Transaction.user_id,
+    models.Transaction.action,
+    models.Transaction.created_at,
+    raiseload=True,
+)
+
+
 class TransactionRepository:
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
@@ -283,6 +446,7 @@ class TransactionRepository:
         stmt: Select[tuple[models.Transaction]] = (
             select(models.Transaction)
             .where(models.Transaction.item_id == item_id)
+            .options(*_load_opts(_TX_SUMMARY))
             .order_by(models.Transaction.created_at.desc())
             .limit(limit)
         )
@@ -293,6 +457,7 @@ class TransactionRepository:
         stmt: Select[tuple[models.Transaction]] = (
             select(models.Transaction)
             .where(models.Transaction.user_id == user_id)
+            .options(*_load_opts(_TX_SUMMARY))
             .order_by(models.Transaction.created_at.desc())
             .limit(limit)
         )
@@ -306,12 +471,52 @@ class TransactionRepository:
         stmt: Select[tuple[models.Transaction]] = (
             select(models.Transaction)
             .where(models.Transaction.item_id == item_id)
-            .options(joinedload(models.Transaction.user))
+            .options(*_load_opts(_TX_SUMMARY, selectinload(models.Transaction.user)))
             .order_by(models.Transaction.created_at.desc())
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        return result.scalars().all()
+
+    async def get_with_user_and_item(self, tx_id: int) -> models.Transaction | None:
+        """Returns a single transaction with user and item eagerly loaded."""
+        stmt: Select[tuple[models.Transaction]] = (
+            select(models.Transaction)
+            .where(models.Transaction.id == tx_id)
+            .options(
+                *_load_opts(
+                    joinedload(models.Transaction.user),
+                    joinedload(models.Transaction.item),
+                )
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_photo_details(self, tx_id: int):
+        """
+        Only the columns needed to show a transaction photo with its caption.
+        Returns a Row (photo_file_id, action, item_id, created_at, item_name,
+        first_name, last_name, username, telegram_id) or None.
+        """
+        stmt = (
+            select(
+                models.Transaction.photo_file_id,
+                models.Transaction.action,
+                models.Transaction.item_id,
+                models.Transaction.created_at,
+                models.Item.name.label("item_name"),
+                models.User.first_name,
+                models.User.last_name,
+                models.User.username,
+                models.User.telegram_id,
+            )
+            .join(models.Item, models.Transaction.item_id == models.Item.id, isouter=True)
+            .join(models.User, models.Transaction.user_id == models.User.id, isouter=True)
+            .where(models.Transaction.id == tx_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
 
     async def get_latest_take_for_item(
         self, item_id: int
@@ -323,42 +528,64 @@ class TransactionRepository:
                 models.Transaction.item_id == item_id,
                 models.Transaction.action == TransactionAction.TAKE,
             )
-            .options(joinedload(models.Transaction.user))
-            .order_by(models.Transaction.created_at.desc())
+            .options(*_load_opts(_TX_SUMMARY, joinedload(models.Transaction.user)))
+            # id order matches ix_tx_item_action_id; ids grow with created_at
+            .order_by(models.Transaction.id.desc())
             .limit(1)
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_all_on_hands_with_details(
-        self,
-    ) -> Sequence[models.Transaction]:
-        """For all currently TAKEN items, return last TAKE transaction with user."""
-        # Subquery: latest TAKE per item
-        from sqlalchemy import func
-        subq = (
-            select(
-                models.Transaction.item_id,
-                func.max(models.Transaction.id).label("max_id"),
+    async def get_latest_takes_for_items(
+        self, item_ids: Sequence[int]
+    ) -> dict[int, models.Transaction]:
+        """Most recent TAKE transaction (with user) per item, in one query."""
+        if not item_ids:
+            return {}
+        # Subquery: id of the latest TAKE per item, picked without a GROUP BY self-join
+        tx = models.Transaction
+        is_take = tx.action == TransactionAction.TAKE
+        if self.session.get_bind().dialect.name == "postgresql":
+            # LATERAL: one ix_tx_item_action_id probe per requested item,
+            # bounded by the items on screen rather than by their whole history
+            take = (
+                select(tx.id)
+                .where(tx.item_id == models.Item.id, is_take)
+                .order_by(tx.id.desc())
+                .limit(1)
+                .lateral("latest_take")
             )
-            .where(models.Transaction.action == TransactionAction.TAKE)
-            .group_by(models.Transaction.item_id)
-            .subquery()
-        )
-        stmt = (
-            select(models.Transaction)
-            .join(subq, models.Transaction.id == subq.c.max_id)
-            .options(
-                joinedload(models.Transaction.user),
-                joinedload(models.Transaction.item),
+            latest = (
+                select(take.c.id)
+                .select_from(models.Item)
+                .join(take, true())
+                .where(models.Item.id.in_(item_ids))
+                .subquery()
             )
-            .order_by(models.Transaction.created_at.desc())
+        else:
+            ranked = (
+                select(
+                    tx.id,
+                    func.row_number()
+                    .over(partition_by=tx.item_id, order_by=tx.id.desc())
+                    .label("rn"),
+                )
+                .where(is_take, tx.item_id.in_(item_ids))
+                .subquery()
+            )
+            latest = select(ranked.c.id).where(ranked.c.rn == 1).subquery()
+        stmt: Select[tuple[models.Transaction]] = (
+            select(tx)
+            .join(latest, tx.id == latest.c.id)
+            .options(*_load_opts(_TX_SUMMARY, joinedload(tx.user)))
         )
         result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        return {t.item_id: t for t in result.scalars().unique().all()}
 
 
 class AdminLogRepository:
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
@@ -369,6 +596,8 @@ class AdminLogRepository:
 
 
 class ProblemReportRepository:
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
@@ -388,8 +617,10 @@ class ProblemReportRepository:
             select(models.ProblemReport)
             .where(models.ProblemReport.is_resolved == False)
             .options(
-                joinedload(models.ProblemReport.item),
-                joinedload(models.ProblemReport.user),
+                *_load_opts(
+                    joinedload(models.ProblemReport.item),
+                    joinedload(models.ProblemReport.user),
+                )
             )
             .order_by(models.ProblemReport.created_at.desc())
         )
@@ -408,8 +639,10 @@ class ProblemReportRepository:
             select(models.ProblemReport)
             .where(models.ProblemReport.id == report_id)
             .options(
-                joinedload(models.ProblemReport.item),
-                joinedload(models.ProblemReport.user),
+                *_load_opts(
+                    joinedload(models.ProblemReport.item),
+                    joinedload(models.ProblemReport.user),
+                )
             )
         )
         result = await self.session.execute(stmt)
@@ -1,12 +1,15 @@
+import logging
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
@@ -16,15 +19,46 @@ class Base(DeclarativeBase):
     pass
 
 
+# async driver used when DB_URL names only the backend ("sqlite://", "postgresql://")
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
+def _async_url(raw: str) -> URL:
+    """Swap a bare backend URL to its async driver so DB calls never block the loop."""
+    url = make_url(raw)
+    backend = url.get_backend_name()
+    if "+" not in url.drivername and backend in _ASYNC_DRIVERS:
+        url = url.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}")
+    return url
+
+
 def get_engine() -> AsyncEngine:
+    # no await in here, so concurrent handlers on the loop can't build a second engine
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_async_engine(settings.db_url, echo=False, future=True)
+        url = _async_url(settings.db_url)
+        engine_kwargs: dict = {
+            "pool_pre_ping": True,
+            # compiled-SQL cache; the default 500 is tight once every query
+            # shape (loader options, dialect branches) gets its own entry
+            "query_cache_size": settings.db_query_cache_size,
+        }
+        # SQLite picks its own pool class; sizing only applies to server DBs
+        if url.get_backend_name() != "sqlite":
+            engine_kwargs.update(
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_recycle=3600,
+            )
+        if url.get_driver_name() == "asyncpg" and "prepared_statement_cache_size" not in url.query:
+            # the asyncpg adapter prepares statements per connection (default cache 100);
+            # leave room for every statement shape the bot issues
+            engine_kwargs["connect_args"] = {"prepared_statement_cache_size": 1024}
+        _engine = create_async_engine(url, echo=False, future=True, **engine_kwargs)
     return _engine
 
 
@@ -34,6 +68,8 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
         _session_factory = async_sessionmaker(
             bind=get_engine(),
             expire_on_commit=False,
+            # services flush explicitly where a later query needs pending rows
+            autoflush=False,
         )
     return _session_factory
 
@@ -48,6 +84,23 @@ async def get_session() -> AsyncIterator[AsyncSession]:
             await session.close()
 
 
+def _create_missing_indexes(sync_conn, metadata) -> None:
+    # one index listing per table instead of a has_index query per index
+    inspector = inspect(sync_conn)
+    for table in metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(sync_conn)
+
+
+async def _warm_pool(engine: AsyncEngine, count: int) -> None:
+    # hold the connections at once, otherwise the pool hands back the same one
+    async with AsyncExitStack() as stack:
+        for _ in range(count):
+            await stack.enter_async_context(engine.connect())
+
+
 async def init_db() -> None:
     """
     Create all tables.
@@ -57,4 +110,13 @@ async def init_db() -> None:
 
     engine = get_engine()
     async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            # trigram ops for the search indexes on items
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(models.Base.metadata.create_all)
+        # create_all skips existing tables, so add indexes introduced later
+        await conn.run_sync(_create_missing_indexes, models.Base.metadata)
+    if engine.dialect.name != "sqlite":
+        settings = get_settings()
+        await _warm_pool(engine, min(settings.db_pool_warm, settings.db_pool_size))
+    logging.info("DB engine ready (%s): %s", engine.dialect.name, engine.pool.status())
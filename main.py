@@ -1,6 +1,7 @@
 import asyncio
 import logging
 
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
@@ -8,6 +9,8 @@ from aiogram.fsm.storage.memory import MemoryStorage
 
 from app.bot.handlers_admin import admin_router
 from app.bot.handlers_user import user_router
+from app.bot.markup_session import MarkupCachingSession
+from app.bot.notify_queue import NotifyQueue
 from app.config import get_settings
 from app.db.session import init_db
 
@@ -18,15 +21,27 @@ logging.basicConfig(
 )
 
 
+def _orjson_dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+
 async def main() -> None:
     settings = get_settings()
     await init_db()
 
+    # orjson is several times faster than stdlib json for keyboard payloads;
+    # memoized keyboards are additionally serialized only once per object
+    session = MarkupCachingSession(json_loads=orjson.loads, json_dumps=_orjson_dumps)
     bot = Bot(
         token=settings.bot_token,
+        session=session,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
-    dp = Dispatcher(storage=MemoryStorage())
+    notify_queue = NotifyQueue(bot)
+    # workflow data is injected into handlers that declare a `notify_queue` argument
+    dp = Dispatcher(storage=MemoryStorage(), notify_queue=notify_queue)
+    dp.startup.register(notify_queue.start)
+    dp.shutdown.register(notify_queue.stop)
 
     # Admin router first so its handlers take priority over user router
     dp.include_router(admin_router)